@@ -70,6 +70,8 @@ def cmd_generate_module(args):
         output_dir=args.output_dir,
         module_name=args.module_name,
         overwrite=True,
+        use_slots=args.slots,
+        max_workers=args.workers or None,
     )
     
     print(f"[OK] Module generation complete!")
@@ -302,6 +304,17 @@ def main():
         "--module-name",
         help="Name for the module (defaults to output-dir basename)",
     )
+    mod_parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=1,
+        help="Processes used to generate schema code (default: 1, 0 for one per CPU)",
+    )
+    mod_parser.add_argument(
+        "--slots",
+        action="store_true",
+        help="Generate slotted dataclasses (smaller, faster instances on Python 3.10+)",
+    )
     mod_parser.set_defaults(func=cmd_generate_module)
     
     # Generate samples command
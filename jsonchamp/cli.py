@@ -123,6 +123,17 @@ Copyright (C) 2025-2030, Ashutosh Sinha. All Rights Reserved.
         default=True,
         help="Overwrite existing files (default: True)",
     )
+    mod_parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=1,
+        help="Processes used to generate schema code (default: 1, 0 for one per CPU)",
+    )
+    mod_parser.add_argument(
+        "--slots",
+        action="store_true",
+        help="Generate slotted dataclasses (smaller, faster instances on Python 3.10+)",
+    )
     
     # Sample command
     sample_parser = subparsers.add_parser(
@@ -257,6 +268,8 @@ def cmd_generate_module(args) -> int:
             output_dir=args.output_dir,
             module_name=args.module_name,
             overwrite=args.overwrite,
+            use_slots=args.slots,
+            max_workers=args.workers or None,
         )
         
         result = generator.generate()
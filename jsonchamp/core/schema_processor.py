@@ -214,6 +214,7 @@ class SchemaProcessor:
         style: str = "dataclass",
         include_validators: bool = True,
         all_fields_optional: bool = False,
+        use_slots: bool = False,
     ) -> str:
         """
         Generate Python source code from the schema.
@@ -222,6 +223,7 @@ class SchemaProcessor:
             style: Code style ("dataclass" or "attrs")
             include_validators: Whether to include validation methods
             all_fields_optional: If True, all fields get defaults (allows empty constructor)
+            use_slots: If True, generate dataclasses with __slots__ on Python 3.10+
             
         Returns:
             Python source code as string
@@ -237,6 +239,7 @@ class SchemaProcessor:
             style=style,
             include_validators=include_validators,
             all_fields_optional=all_fields_optional,
+            use_slots=use_slots,
         )
         
         return generator.generate()
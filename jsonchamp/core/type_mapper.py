@@ -22,7 +22,7 @@ Handles complex type mappings including:
 - Custom type mappings
 """
 
-from typing import Any, Dict, List, Optional, Set, Type, Union, get_type_hints
+from typing import Any, Callable, Dict, List, Optional, Set, Type, Union, get_type_hints
 from datetime import datetime, date, time
 from decimal import Decimal
 from uuid import UUID
@@ -147,6 +147,12 @@ class TypeMapper:
         
         # Track generated custom classes
         self.custom_classes: Dict[str, Dict[str, Any]] = {}
+        
+        # Handlers for single schema types; anything else maps as a scalar
+        self._type_dispatch: Dict[str, Callable[..., TypeMapping]] = {
+            "array": lambda schema, property_name: self._map_array(schema),
+            "object": self._map_object,
+        }
     
     def map_schema(self, schema: Dict[str, Any], property_name: Optional[str] = None) -> TypeMapping:
         """
@@ -222,17 +228,14 @@ class TypeMapper:
                 import_statement=self.DEFAULT_IMPORTS.get(py_type),
             )
         
+        # Handle arrays and objects
+        handler = self._type_dispatch.get(schema_type)
+        if handler is not None:
+            return handler(schema, property_name)
+        
         # Map the base type
         py_type = self.type_map.get(schema_type, Any)
         
-        # Handle arrays
-        if schema_type == "array":
-            return self._map_array(schema)
-        
-        # Handle objects
-        if schema_type == "object":
-            return self._map_object(schema, property_name)
-        
         # Get default value representation
         default_val = self._get_default_repr(schema, py_type)
         
@@ -32,6 +32,11 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+# Homogeneous numeric arrays shorter than this are cheaper to check in Python
+NUMERIC_FAST_PATH_MIN_ITEMS = 32
+
+# Item schemas consisting only of these keywords qualify for the fast path
+_RANGE_ONLY_KEYWORDS = frozenset(("type", "minimum", "maximum"))
 
 class ValidationSeverity(Enum):
     """Severity level for validation errors."""
@@ -329,7 +334,9 @@ class SchemaValidator:
         # Handle array items
         if schema_type == "array" and isinstance(data, list):
             items_schema = schema.get("items")
-            if items_schema:
+            if items_schema and not self._validate_numeric_items(
+                data, items_schema, path, result
+            ):
                 for i, item in enumerate(data):
                     item_result = self._basic_validate(
                         item,
@@ -391,6 +398,61 @@ class SchemaValidator:
         
         return result
     
+    def _validate_numeric_items(
+        self,
+        data: List[Any],
+        items_schema: Dict[str, Any],
+        path: str,
+        result: ValidationResult,
+    ) -> bool:
+        """
+        Range-check a long homogeneous numeric array in one pass.
+        
+        Only applies when the item schema is a plain integer/number type with
+        optional minimum/maximum. Values are compared as they are, so large
+        integers stay exact, and issues are reported in the same order as
+        per-item validation would.
+        
+        Returns:
+            True if the array was validated here, False to fall back to
+            per-item validation
+        """
+        if len(data) <= NUMERIC_FAST_PATH_MIN_ITEMS:
+            return False
+        if not isinstance(items_schema, dict) or not _RANGE_ONLY_KEYWORDS.issuperset(items_schema):
+            return False
+        
+        item_type = items_schema.get("type")
+        if item_type not in ("integer", "number"):
+            return False
+        allowed = int if item_type == "integer" else (int, float)
+        for item in data:
+            if not isinstance(item, allowed) or isinstance(item, bool):
+                return False
+        
+        minimum = items_schema.get("minimum")
+        maximum = items_schema.get("maximum")
+        if minimum is None and maximum is None:
+            return True
+        
+        lo = float("-inf") if minimum is None else minimum
+        hi = float("inf") if maximum is None else maximum
+        # Index order, minimum before maximum for the same item
+        for i, value in enumerate(data):
+            if value < lo:
+                result.add_issue(ValidationIssue(
+                    path=f"{path}[{i}]",
+                    message=f"Value must be >= {minimum}",
+                    rule="minimum",
+                ))
+            if value > hi:
+                result.add_issue(ValidationIssue(
+                    path=f"{path}[{i}]",
+                    message=f"Value must be <= {maximum}",
+                    rule="maximum",
+                ))
+        return True
+    
     def _check_type(self, value: Any, expected_type: Union[str, List[str]]) -> bool:
         """Check if a value matches the expected type(s)."""
         if isinstance(expected_type, list):
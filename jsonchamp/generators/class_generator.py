@@ -175,6 +175,7 @@ class ClassGenerator:
         class_dict = {
             "__annotations__": annotations,
             "_property_mapping": property_mapping,
+            "_reverse_property_mapping": {v: k for k, v in property_mapping.items()},
             "_schema": schema,
             **defaults,
         }
@@ -240,7 +241,7 @@ class ClassGenerator:
         @classmethod
         def from_dict(cls, data: Dict[str, Any]):
             """Create instance from dictionary."""
-            reverse_mapping = {v: k for k, v in cls._property_mapping.items()}
+            reverse_mapping = cls._reverse_property_mapping
             kwargs = {}
             for json_name, value in data.items():
                 py_name = reverse_mapping.get(json_name, json_name)
@@ -48,6 +48,7 @@ class CodeGenerator:
         include_validators: bool = True,
         include_docstrings: bool = True,
         all_fields_optional: bool = False,
+        use_slots: bool = False,
     ):
         """
         Initialize the code generator.
@@ -61,6 +62,8 @@ class CodeGenerator:
             include_validators: Whether to include validation methods
             include_docstrings: Whether to include docstrings
             all_fields_optional: If True, all fields get default None (allows empty constructor)
+            use_slots: If True, emit slotted dataclasses (slots=True on Python 3.10+,
+                regular dataclasses on older interpreters)
         """
         self.schema = schema
         self.resolver = resolver or ReferenceResolver(schema)
@@ -70,6 +73,7 @@ class CodeGenerator:
         self.include_validators = include_validators
         self.include_docstrings = include_docstrings
         self.all_fields_optional = all_fields_optional
+        self.use_slots = use_slots
         
         # Get resolved schema
         self.resolved_schema = self.resolver.resolve_all()
@@ -83,31 +87,33 @@ class CodeGenerator:
         # Track generated class names
         self._generated_classes: Set[str] = set()
         
+        # Cached class structure, built on first generate()
+        self._class_nodes: Optional[List[Dict[str, Any]]] = None
+        
         # Track required imports
         self._imports: Set[str] = set()
     
-    def generate(self) -> str:
+    def generate(self, include_validators: Optional[bool] = None) -> str:
         """
         Generate Python source code.
         
+        The class structure is built once and cached, so rendering the same
+        schema with and without validators only walks the schema once.
+        
+        Args:
+            include_validators: Override the include_validators setting for
+                this render (None uses the value given at construction)
+        
         Returns:
             Complete Python module as a string
         """
-        lines = []
+        if include_validators is None:
+            include_validators = self.include_validators
         
-        # Generate classes
-        class_codes = []
+        lines = []
         
-        # Generate definition classes first
-        for def_name, def_schema in self.definitions.items():
-            if def_schema.get("type") == "object" or "properties" in def_schema:
-                class_code = self._generate_class(def_name, def_schema)
-                class_codes.append(class_code)
-        
-        # Generate root class
-        if self.resolved_schema.get("type") == "object" or "properties" in self.resolved_schema:
-            class_code = self._generate_class(self.root_class_name, self.resolved_schema)
-            class_codes.append(class_code)
+        # Build (or reuse) the class structure
+        class_nodes = self._build_class_nodes()
         
         # Build complete module
         lines.append(self._generate_header())
@@ -117,16 +123,40 @@ class CodeGenerator:
         lines.append("")
         
         # Add ValidationResult class first
-        lines.append(self._generate_validation_result_class())
-        lines.append("")
+        if include_validators:
+            lines.append(self._generate_validation_result_class())
+            lines.append("")
         
         # Add classes
-        for class_code in class_codes:
-            lines.append(class_code)
+        for node in class_nodes:
+            lines.append(self._render_class(node, include_validators))
             lines.append("")
         
         return "\n".join(lines)
     
+    def _build_class_nodes(self) -> List[Dict[str, Any]]:
+        """Walk the schema once and cache the per-class field structure."""
+        if self._class_nodes is not None:
+            return self._class_nodes
+        
+        class_nodes = []
+        
+        # Generate definition classes first
+        for def_name, def_schema in self.definitions.items():
+            if def_schema.get("type") == "object" or "properties" in def_schema:
+                node = self._build_class_node(def_name, def_schema)
+                if node:
+                    class_nodes.append(node)
+        
+        # Generate root class
+        if self.resolved_schema.get("type") == "object" or "properties" in self.resolved_schema:
+            node = self._build_class_node(self.root_class_name, self.resolved_schema)
+            if node:
+                class_nodes.append(node)
+        
+        self._class_nodes = class_nodes
+        return class_nodes
+    
     def _generate_header(self) -> str:
         """Generate module docstring."""
         return f'''"""
@@ -169,47 +199,38 @@ class ValidationResult:
             "from datetime import datetime, date",
         ]
         
+        if self.use_slots and self.style == "dataclass":
+            imports.insert(2, "import sys")
+        
         # Add collected imports
         for imp in sorted(self._imports):
             if imp not in "\n".join(imports):
                 imports.append(imp)
         
+        if self.use_slots and self.style == "dataclass":
+            imports.extend([
+                "",
+                "# slots=True needs Python 3.10+; older interpreters get regular dataclasses",
+                '_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}',
+            ])
+        
         return "\n".join(imports)
     
-    def _generate_class(
+    def _build_class_node(
         self,
         class_name: str,
         schema: Dict[str, Any],
-    ) -> str:
-        """Generate code for a single class."""
+    ) -> Optional[Dict[str, Any]]:
+        """Collect the field structure for a single class."""
         if class_name in self._generated_classes:
-            return ""
+            return None
         
         self._generated_classes.add(class_name)
         
-        lines = []
-        
-        # Class decorator
-        if self.style == "dataclass":
-            lines.append("@dataclass")
-        
-        # Class definition
-        lines.append(f"class {class_name}:")
-        
-        # Docstring
-        if self.include_docstrings:
-            description = schema.get("description", f"Generated class for {class_name}.")
-            lines.append(f'    """{description}"""')
-            lines.append("")
-        
         # Get properties
         properties = schema.get("properties", {})
         required = set(schema.get("required", []))
         
-        if not properties:
-            lines.append("    pass")
-            return "\n".join(lines)
-        
         # Separate required and optional fields
         required_fields = []
         optional_fields = []
@@ -235,6 +256,39 @@ class ValidationResult:
             else:
                 optional_fields.append(field_info)
         
+        return {
+            "class_name": class_name,
+            "schema": schema,
+            "required_fields": required_fields,
+            "optional_fields": optional_fields,
+        }
+    
+    def _render_class(self, node: Dict[str, Any], include_validators: bool = True) -> str:
+        """Generate code for a single class from its cached structure."""
+        class_name = node["class_name"]
+        schema = node["schema"]
+        required_fields = node["required_fields"]
+        optional_fields = node["optional_fields"]
+        
+        lines = []
+        
+        # Class decorator
+        if self.style == "dataclass":
+            lines.append("@dataclass(**_DATACLASS_OPTIONS)" if self.use_slots else "@dataclass")
+        
+        # Class definition
+        lines.append(f"class {class_name}:")
+        
+        # Docstring
+        if self.include_docstrings:
+            description = schema.get("description", f"Generated class for {class_name}.")
+            lines.append(f'    """{description}"""')
+            lines.append("")
+        
+        if not required_fields and not optional_fields:
+            lines.append("    pass")
+            return "\n".join(lines)
+        
         # Property mapping for JSON serialization - use a class variable (ClassVar)
         # instead of a dataclass field to avoid mutable default issues
         lines.append("    # Property name mapping for JSON serialization")
@@ -295,7 +349,7 @@ class ValidationResult:
         # Add methods - pass required fields and all fields for validation
         lines.append("")
         all_fields = required_fields + optional_fields
-        lines.extend(self._generate_methods(class_name, required_fields, all_fields))
+        lines.extend(self._generate_methods(class_name, required_fields, all_fields, include_validators))
         
         return "\n".join(lines)
     
@@ -348,7 +402,13 @@ class ValidationResult:
             return description
         return ""
     
-    def _generate_methods(self, class_name: str, required_fields: List[Dict] = None, all_fields: List[Dict] = None) -> List[str]:
+    def _generate_methods(
+        self,
+        class_name: str,
+        required_fields: List[Dict] = None,
+        all_fields: List[Dict] = None,
+        include_validators: bool = True,
+    ) -> List[str]:
         """Generate serialization and validation methods."""
         methods = []
         required_fields = required_fields or []
@@ -385,17 +445,35 @@ class ValidationResult:
             "",
         ])
         
-        # from_dict class method
+        # from_dict class method - only renamed properties need a reverse
+        # lookup, and those are known now rather than on every call
+        renamed = [
+            f'"{f["original_name"]}": "{f["name"]}"'
+            for f in all_fields
+            if f["name"] != f["original_name"]
+        ]
         methods.extend([
             "    @classmethod",
             f"    def from_dict(cls, data: Dict[str, Any]) -> '{class_name}':",
             '        """Create instance from dictionary."""',
-            "        reverse_mapping = {v: k for k, v in cls._get_json_mapping().items()}",
-            "        kwargs = {}",
-            "        for json_name, value in data.items():",
-            "            py_name = reverse_mapping.get(json_name, json_name)",
-            "            if py_name in cls.__annotations__:",
-            "                kwargs[py_name] = value",
+        ])
+        if renamed:
+            methods.extend([
+                f"        reverse_mapping = {{{', '.join(renamed)}}}",
+                "        kwargs = {}",
+                "        for json_name, value in data.items():",
+                "            py_name = reverse_mapping.get(json_name, json_name)",
+                "            if py_name in cls.__annotations__:",
+                "                kwargs[py_name] = value",
+            ])
+        else:
+            methods.extend([
+                "        kwargs = {}",
+                "        for json_name, value in data.items():",
+                "            if json_name in cls.__annotations__:",
+                "                kwargs[json_name] = value",
+            ])
+        methods.extend([
             "        return cls(**kwargs)",
             "",
         ])
@@ -406,9 +484,13 @@ class ValidationResult:
             f"    def from_json(cls, json_str: str) -> '{class_name}':",
             '        """Create instance from JSON string."""',
             "        return cls.from_dict(json.loads(json_str))",
-            "",
         ])
         
+        if not include_validators:
+            return methods
+        
+        methods.append("")
+        
         # Generate _get_required_fields method
         required_field_names = [f['name'] for f in required_fields]
         methods.extend([
@@ -20,6 +20,7 @@ Features:
 - Customizable generation strategies
 """
 
+import functools
 import json
 import random
 import string
@@ -35,6 +36,12 @@ except ImportError:
     HAS_FAKER = False
 
 
+@functools.lru_cache(maxsize=None)
+def _get_faker(locale: str) -> "Faker":
+    """Return a shared Faker instance per locale (construction loads locale data)."""
+    return Faker(locale)
+
+
 class SampleGenerator:
     """
     Generates sample JSON data from JSON Schema.
@@ -77,7 +84,7 @@ class SampleGenerator:
         
         # Initialize Faker
         if self.use_faker:
-            self.fake = Faker(locale)
+            self.fake = _get_faker(locale)
             if seed is not None:
                 Faker.seed(seed)
         else:
@@ -22,7 +22,7 @@ import sys
 import json
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 
 from .core.schema_processor import SchemaProcessor
@@ -158,6 +158,8 @@ class ModuleGenerator:
         module_name: Optional[str] = None,
         overwrite: bool = True,
         all_fields_optional: bool = True,
+        use_slots: bool = False,
+        max_workers: Optional[int] = 1,
     ):
         """
         Initialize the module generator.
@@ -168,12 +170,17 @@ class ModuleGenerator:
             module_name: Name for the module (default: "mymodule")
             overwrite: Whether to overwrite existing files (default: True)
             all_fields_optional: If True, all fields get defaults allowing empty constructor (default: True)
+            use_slots: If True, generated dataclasses use __slots__ on Python 3.10+
+            max_workers: Processes used to generate schema code in parallel
+                (default: 1, sequential; None uses one per CPU)
         """
         self.schema_dir = Path(schema_dir).resolve()
         self.output_dir = Path(output_dir).resolve()
         self.module_name = module_name or self.DEFAULT_MODULE_NAME
         self.overwrite = overwrite
         self.all_fields_optional = all_fields_optional
+        self.use_slots = use_slots
+        self.max_workers = max_workers
         
         # Module directory is inside output_dir
         self.module_dir = self.output_dir / self.module_name
@@ -237,18 +244,12 @@ class ModuleGenerator:
         file_to_class = {fname: info[1] for fname, info in schema_info.items()}
         
         # === SECOND PASS: Generate code with proper imports ===
+        generated_code = self._generate_schema_code(schema_info)
         for filename, (schema, class_name, module_name, schema_file) in schema_info.items():
             try:
-                # Pass base_uri for resolving relative $ref like "Bond.json"
-                processor = SchemaProcessor(
-                    schema, 
-                    root_class_name=class_name,
-                    base_uri=str(schema_file.resolve())
-                )
-                code = processor.generate_code(
-                    style="dataclass",
-                    all_fields_optional=self.all_fields_optional
-                )
+                code, error = generated_code[filename]
+                if error is not None:
+                    raise ValueError(error)
                 
                 # Find $ref references to other schema files
                 refs = _extract_file_refs(schema)
@@ -292,8 +293,7 @@ class ModuleGenerator:
                     full_code = '\n'.join(lines)
                 
                 output_path = generated_dir / f"{module_name}.py"
-                with open(output_path, 'w') as f:
-                    f.write(full_code)
+                output_path.write_bytes(full_code.encode("utf-8"))
                 
                 results["schemas_processed"] += 1
                 results["files_created"].append(str(output_path))
@@ -317,6 +317,40 @@ class ModuleGenerator:
         
         return results
     
+    def _generate_schema_code(
+        self,
+        schema_info: Dict[str, Tuple[Dict[str, Any], str, str, Path]],
+    ) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Generate dataclass code for every schema, in parallel when enabled.
+        
+        Each schema is independent and code generation is CPU-bound, so with
+        max_workers other than 1 the work is spread over a process pool.
+        
+        Returns:
+            Dictionary mapping schema filename to (code, error)
+        """
+        filenames = list(schema_info)
+        jobs = (
+            [schema_info[name][0] for name in filenames],
+            [schema_info[name][1] for name in filenames],
+            # Pass base_uri for resolving relative $ref like "Bond.json"
+            [str(schema_info[name][3].resolve()) for name in filenames],
+            [self.all_fields_optional] * len(filenames),
+            [self.use_slots] * len(filenames),
+        )
+        
+        if self.max_workers == 1 or len(filenames) < 2:
+            outputs = list(map(_generate_schema_code, *jobs))
+        else:
+            # Imported here: the process pool machinery is only needed with -j
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                outputs = list(executor.map(_generate_schema_code, *jobs, chunksize=4))
+        
+        return dict(zip(filenames, outputs))
+    
     def _generate_init_files(self, results: Dict[str, Any]) -> None:
         """Generate __init__.py files."""
         timestamp = datetime.now().isoformat()
@@ -324,15 +358,13 @@ class ModuleGenerator:
         # generated/__init__.py
         generated_init = self._create_generated_init(timestamp)
         init_path = self.module_dir / "generated" / "__init__.py"
-        with open(init_path, 'w') as f:
-            f.write(generated_init)
+        init_path.write_bytes(generated_init.encode("utf-8"))
         results["files_created"].append(str(init_path))
         
         # main __init__.py
         main_init = self._create_main_init(timestamp)
         init_path = self.module_dir / "__init__.py"
-        with open(init_path, 'w') as f:
-            f.write(main_init)
+        init_path.write_bytes(main_init.encode("utf-8"))
         results["files_created"].append(str(init_path))
     
     def _create_generated_init(self, timestamp: str) -> str:
@@ -415,6 +447,7 @@ class ModuleGenerator:
             'from .driver import (',
             '    load_json,',
             '    load_json_file,',
+            '    load_json_large,',
             '    load_json_string,',
             '    load_dict,',
             '    to_json,',
@@ -432,6 +465,7 @@ class ModuleGenerator:
             '    load_and_parse,',
             '    create_and_save,',
             '    generate_sample,',
+            '    generate_sample_for_class,',
             '    convert_json,',
             '    run_cli,',
             ')',
@@ -458,18 +492,405 @@ This module provides utility functions for:
 - Class introspection and validation
 """
 
+import functools
 import json
+import math
+import mmap
+import os
+import re
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
-from dataclasses import is_dataclass, fields
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Type, TypeVar, Union, get_type_hints
+from dataclasses import MISSING, is_dataclass, fields
 from datetime import datetime, date
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
 
 from .generated import CLASS_REGISTRY, get_class
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 T = TypeVar('T')
 
 
+class _ClassMeta(NamedTuple):
+    """Field metadata for a dataclass, built once on first use."""
+    field_types: Dict[str, Any]
+    json_to_py: Optional[Dict[str, str]]
+    py_to_json: Dict[str, str]
+    converters: Dict[str, Callable[[Any], Any]]
+    required_py: Tuple[str, ...]
+    optional_py: Tuple[str, ...]
+
+
+class _ClassBundle(NamedTuple):
+    """Everything the public entry points need for a class, looked up by name."""
+    cls: type
+    meta: _ClassMeta
+    required: Tuple[Tuple[str, str], ...]
+    required_json_names: FrozenSet[str]
+    required_py_names: FrozenSet[str]
+
+
+# Per-class metadata cache: class -> _ClassMeta
+_CLASS_META: Dict[type, _ClassMeta] = {{}}
+
+# class -> compiled dict-to-instance loader, see _build_loader()
+_LOADERS: Dict[type, Callable[[Dict[str, Any]], Any]] = {{}}
+
+# class -> compiled instance-to-dict dumper, see _build_dumper()
+_DUMPERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {{}}
+
+# Generated classes are registered once at import, so the names never change
+_CLASS_NAMES = tuple(CLASS_REGISTRY)
+
+# Field types that to_dict() passes through unchanged
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+# Digit runs long enough to be an integer orjson cannot hold exactly
+_WIDE_INT_BYTES = re.compile(rb"\\d{{19,}}")
+_WIDE_INT_TEXT = re.compile(r"\\d{{19,}}")
+
+# Placeholder for "not parsed yet", since null is a valid JSON document
+_MISSING_DATA = object()
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" natively
+    _parse_dt = datetime.fromisoformat
+else:
+    def _parse_dt(value: str) -> datetime:
+        """Parse an ISO 8601 datetime, accepting a trailing "Z" for UTC."""
+        if value.endswith('Z'):
+            return datetime.fromisoformat(value[:-1] + '+00:00')
+        return datetime.fromisoformat(value)
+
+
+def _strip_optional(field_type: Any) -> Any:
+    """Resolve Optional[X] to X once so conversion does not re-probe the Union."""
+    if getattr(field_type, '__origin__', None) is Union:
+        non_none = [t for t in field_type.__args__ if t is not type(None)]
+        if non_none:
+            return non_none[0]
+    return field_type
+
+
+def _identity(value: Any) -> Any:
+    """Converter for values that need no conversion."""
+    return value
+
+
+def _make_converter(field_type: Any) -> Callable[[Any], Any]:
+    """
+    Build a converter for a field type, resolving its shape once.
+    
+    The returned callable takes a raw JSON value and returns the value to
+    pass to the dataclass constructor.
+    """
+    field_type = _strip_optional(field_type)
+    origin = getattr(field_type, '__origin__', None)
+    
+    if origin is list:
+        args = getattr(field_type, '__args__', None)
+        return _make_list_converter(_strip_optional(args[0]) if args else Any)
+    
+    if origin is dict:
+        return _identity
+    
+    if isinstance(field_type, type) and is_dataclass(field_type):
+        return lambda value: load_dict(value, field_type) if isinstance(value, dict) else value
+    
+    if field_type is datetime:
+        return lambda value: (
+            _parse_dt(value) if isinstance(value, str) else value
+        )
+    
+    if field_type is date:
+        return lambda value: date.fromisoformat(value) if isinstance(value, str) else value
+    
+    return _identity
+
+
+def _make_list_converter(item_type: Any) -> Callable[[Any], Any]:
+    """
+    Build a converter for List[item_type] with the item type resolved once.
+    
+    Lists of primitives are shallow-copied without visiting each element;
+    dataclass and datetime items are converted in a single comprehension.
+    """
+    if isinstance(item_type, type) and is_dataclass(item_type):
+        return lambda value: None if value is None else [
+            load_dict(item, item_type) if isinstance(item, dict) else item
+            for item in value
+        ]
+    
+    if item_type is datetime:
+        return lambda value: None if value is None else [
+            _parse_dt(item) if isinstance(item, str) else item
+            for item in value
+        ]
+    
+    item_converter = _make_converter(item_type)
+    if item_converter is _identity:
+        return lambda value: None if value is None else list(value)
+    return lambda value: None if value is None else [item_converter(item) for item in value]
+
+
+def _resolve_type_hints(cls: type) -> Dict[str, Any]:
+    """
+    Evaluate a dataclass's field annotations to real types.
+    
+    Generated modules use postponed (string) annotations, and some of them
+    name classes that are never defined. When the class as a whole cannot
+    be resolved, each field is tried on its own and unresolvable fields
+    keep their string annotation, which loads and dumps them unchanged.
+    """
+    try:
+        return get_type_hints(cls)
+    except Exception:
+        pass
+    
+    module = sys.modules.get(cls.__module__)
+    globalns = vars(module) if module is not None else {{}}
+    hints = {{}}
+    for f in fields(cls):
+        holder = type("_Hint", (), {{"__annotations__": {{f.name: f.type}}}})
+        try:
+            hints[f.name] = get_type_hints(holder, globalns, dict(vars(cls)))[f.name]
+        except Exception:
+            hints[f.name] = f.type
+    return hints
+
+
+def _get_meta(cls: type) -> _ClassMeta:
+    """
+    Get cached field metadata for a dataclass.
+    
+    field_types maps each Python field name to its type with Optional
+    already stripped; converters maps it to a prebuilt value converter.
+    json_to_py holds only renamed properties and is None when there are none.
+    required_py / optional_py partition the fields by whether they have a
+    default or default_factory.
+    """
+    meta = _CLASS_META.get(cls)
+    if meta is not None:
+        return meta
+    
+    if not is_dataclass(cls):
+        raise TypeError(f"{{cls}} is not a dataclass")
+    
+    hints = _resolve_type_hints(cls)
+    field_types = {{f.name: _strip_optional(hints.get(f.name, f.type)) for f in fields(cls)}}
+    py_to_json = {{}}
+    if hasattr(cls, '_get_json_mapping'):
+        # Intern the names so lookups against them can match on identity
+        py_to_json = {{
+            sys.intern(k): sys.intern(v) for k, v in cls._get_json_mapping().items()
+        }}
+    json_to_py = {{v: k for k, v in py_to_json.items() if k != v}} or None
+    converters = {{name: _make_converter(t) for name, t in field_types.items()}}
+    required_py = []
+    optional_py = []
+    for f in fields(cls):
+        if f.default is MISSING and f.default_factory is MISSING:
+            required_py.append(f.name)
+        else:
+            optional_py.append(f.name)
+    
+    meta = _ClassMeta(
+        field_types, json_to_py, py_to_json, converters,
+        tuple(required_py), tuple(optional_py),
+    )
+    _CLASS_META[cls] = meta
+    return meta
+
+
+def _build_loader(cls: type) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compile a loader function specialized for one dataclass.
+    
+    The generated source checks each known key by name and calls the
+    class with only the fields present, so omitted fields keep their
+    dataclass defaults. Fields whose converter is the identity are read
+    directly instead of through a function call.
+    
+    Flat classes (no renamed fields, no conversions) first try passing the
+    input straight to the constructor when it has no unknown keys.
+    """
+    meta = _get_meta(cls)
+    namespace: Dict[str, Any] = {{"_cls": cls}}
+    lines = [f"def _load_{{cls.__name__}}(data):"]
+    
+    flat = meta.json_to_py is None and all(
+        converter is _identity for converter in meta.converters.values()
+    )
+    if flat:
+        namespace["_field_names"] = frozenset(meta.field_types)
+        lines.append("    if data.keys() <= _field_names:")
+        lines.append("        return _cls(**data)")
+    lines.append("    kwargs = {{}}")
+    
+    for index, py_name in enumerate(meta.field_types):
+        json_name = meta.py_to_json.get(py_name, py_name)
+        keys = [json_name]
+        # Python names are accepted too, unless another field owns that JSON name
+        if py_name != json_name and py_name not in meta.json_to_py:
+            keys.append(py_name)
+        
+        converter = meta.converters[py_name]
+        if converter is not _identity:
+            namespace[f"_c{{index}}"] = converter
+        
+        for position, key in enumerate(keys):
+            keyword = "if" if position == 0 else "elif"
+            value = f"data[{{key!r}}]"
+            if converter is not _identity:
+                value = f"_c{{index}}({{value}})"
+            lines.append(f"    {{keyword}} {{key!r}} in data:")
+            lines.append(f"        kwargs[{{py_name!r}}] = {{value}}")
+    
+    lines.append("    return _cls(**kwargs)")
+    exec("\\n".join(lines), namespace)
+    loader = namespace[f"_load_{{cls.__name__}}"]
+    _LOADERS[cls] = loader
+    return loader
+
+
+@functools.lru_cache(maxsize=None)
+def _class_bundle(class_name: str) -> _ClassBundle:
+    """
+    Resolve a class name to its class, metadata and required fields.
+    
+    Generated classes never change at runtime, so the result is cached for
+    the life of the process. Unknown names raise ValueError and are not
+    cached.
+    """
+    target_class = get_class(class_name)
+    if target_class is None:
+        raise ValueError(f"Unknown class: {{class_name}}. Available: {{list_classes()}}")
+    
+    meta = _get_meta(target_class)
+    py_to_json = meta.py_to_json
+    required = tuple((py_to_json.get(name, name), name) for name in meta.required_py)
+    return _ClassBundle(
+        target_class,
+        meta,
+        required,
+        frozenset(json_name for json_name, _ in required),
+        frozenset(meta.required_py),
+    )
+
+
+def _dump_expression(field_type: Any, value: str) -> str:
+    """
+    Get the source expression that serializes one field value.
+    
+    Plain scalars are emitted as-is and lists of them are shallow-copied;
+    anything else goes through to_dict().
+    """
+    field_type = _strip_optional(field_type)
+    if field_type in _PLAIN_TYPES:
+        return value
+    if getattr(field_type, '__origin__', None) is list:
+        args = getattr(field_type, '__args__', ())
+        if args and _strip_optional(args[0]) in _PLAIN_TYPES:
+            return f"list({{value}}) if {{value}} is not None else None"
+    return f"_to_dict({{value}})"
+
+
+def _build_dumper(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Compile a serializer function specialized for one dataclass.
+    
+    The generated source builds the output dict in a single literal with
+    the JSON property names baked in as constants.
+    """
+    meta = _get_meta(cls)
+    lines = [f"def _dump_{{cls.__name__}}(obj):", "    return {{"]
+    for py_name, field_type in meta.field_types.items():
+        json_name = meta.py_to_json.get(py_name, py_name)
+        lines.append(f"        {{json_name!r}}: {{_dump_expression(field_type, 'obj.' + py_name)}},")
+    lines.append("    }}")
+    
+    namespace: Dict[str, Any] = {{"_to_dict": to_dict}}
+    exec("\\n".join(lines), namespace)
+    dumper = namespace[f"_dump_{{cls.__name__}}"]
+    _DUMPERS[cls] = dumper
+    return dumper
+
+
+def _orjson_exact(content: Any) -> bool:
+    """
+    Check whether orjson would parse content without losing precision.
+    
+    orjson silently turns integers wider than 64 bits into floats, so any
+    input with a run of 19 or more digits is left to the standard library.
+    """
+    pattern = _WIDE_INT_TEXT if isinstance(content, str) else _WIDE_INT_BYTES
+    return pattern.search(content) is None
+
+
+def _loads(content: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or UTF-8 bytes, using orjson when it is exact.
+    
+    Input orjson rejects (such as NaN) or would round is parsed by the
+    standard library, which also supplies the error message.
+    """
+    if HAS_ORJSON and _orjson_exact(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data holds a NaN or infinite float at any depth."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, float):
+            if not math.isfinite(node):
+                return True
+        elif isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return False
+
+
+def _dumps(data: Any, indent: Optional[int] = 2) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+    
+    Uses orjson for the indent=2 and compact cases, falling back to the
+    standard library for other indents, values orjson cannot encode, and
+    NaN/Infinity, which orjson would write as null.
+    No default= hook is passed: to_dict() has already lowered every value
+    to a JSON-native type, so both encoders stay on their C fast path.
+    """
+    if HAS_ORJSON and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        try:
+            encoded = orjson.dumps(data, option=option)
+        except (orjson.JSONEncodeError, TypeError):
+            pass
+        else:
+            # Without a null in the output there was nothing non-finite to replace
+            if b"null" not in encoded or not _has_non_finite(data):
+                return encoded
+        # Compact output keeps orjson's separators
+        if indent is None:
+            return json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return json.dumps(data, indent=indent).encode("utf-8")
+
+
 # ============================================================================
 # JSON LOADING FUNCTIONS
 # ============================================================================
@@ -488,10 +909,7 @@ def load_json(file_path: Union[str, Path], class_name: str) -> Any:
     Example:
         user = load_json("user.json", "User")
     """
-    target_class = get_class(class_name)
-    if target_class is None:
-        raise ValueError(f"Unknown class: {{class_name}}. Available: {{list_classes()}}")
-    return load_json_file(file_path, target_class)
+    return load_json_file(file_path, _class_bundle(class_name).cls)
 
 
 def load_json_file(file_path: Union[str, Path], target_class: Type[T]) -> T:
@@ -505,16 +923,59 @@ def load_json_file(file_path: Union[str, Path], target_class: Type[T]) -> T:
     Returns:
         Instance of target_class populated with JSON data
     """
-    file_path = Path(file_path)
-    if not file_path.exists():
+    file_path = os.fspath(file_path)
+    if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {{file_path}}")
     
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(file_path, "rb") as f:
+        data = _loads(f.read())
     
     return load_dict(data, target_class)
 
 
+def load_json_large(file_path: Union[str, Path], target_class: Type[T]) -> Union[T, List[T]]:
+    """
+    Load a large JSON file, memory-mapping it when orjson is available.
+    
+    orjson parses straight from the mapped pages, so no intermediate copy
+    of the file is held in memory. A top-level array is loaded as a list
+    of instances with the class loader resolved once.
+    
+    Args:
+        file_path: Path to the JSON file
+        target_class: The dataclass type to instantiate
+        
+    Returns:
+        Instance of target_class, or a list of them for a JSON array
+    """
+    file_path = os.fspath(file_path)
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {{file_path}}")
+    
+    with open(file_path, "rb") as f:
+        data = _MISSING_DATA
+        # mmap cannot map an empty file; let the parser report it instead
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _orjson_exact(mm):
+                    with memoryview(mm) as view:
+                        try:
+                            data = orjson.loads(view)
+                        except orjson.JSONDecodeError:
+                            pass
+        if data is _MISSING_DATA:
+            f.seek(0)
+            data = json.loads(f.read())
+    
+    loader = _LOADERS.get(target_class)
+    if loader is None:
+        loader = _build_loader(target_class)
+    
+    if isinstance(data, list):
+        return [loader(item) for item in data]
+    return loader(data)
+
+
 def load_json_string(json_str: str, target_class: Type[T]) -> T:
     """
     Load a JSON string into a dataclass instance.
@@ -526,7 +987,7 @@ def load_json_string(json_str: str, target_class: Type[T]) -> T:
     Returns:
         Instance of target_class populated with JSON data
     """
-    data = json.loads(json_str)
+    data = _loads(json_str)
     return load_dict(data, target_class)
 
 
@@ -541,62 +1002,10 @@ def load_dict(data: Dict[str, Any], target_class: Type[T]) -> T:
     Returns:
         Instance of target_class populated with data
     """
-    if not is_dataclass(target_class):
-        raise TypeError(f"{{target_class}} is not a dataclass")
-    
-    field_types = {{f.name: f.type for f in fields(target_class)}}
-    processed_data = {{}}
-    
-    # Handle JSON property name mapping
-    json_mapping = {{}}
-    if hasattr(target_class, '_get_json_mapping'):
-        mapping = target_class._get_json_mapping()
-        json_mapping = {{v: k for k, v in mapping.items()}}  # Reverse: json_name -> py_name
-    
-    for json_name, value in data.items():
-        # Convert JSON name to Python field name
-        py_name = json_mapping.get(json_name, json_name)
-        
-        if py_name not in field_types:
-            continue
-            
-        field_type = field_types[py_name]
-        processed_data[py_name] = _convert_value(value, field_type)
-    
-    return target_class(**processed_data)
-
-
-def _convert_value(value: Any, target_type: Any) -> Any:
-    """Convert a value to the target type."""
-    if value is None:
-        return None
-    
-    origin = getattr(target_type, '__origin__', None)
-    
-    if origin is Union:
-        args = target_type.__args__
-        non_none = [t for t in args if t is not type(None)]
-        if non_none:
-            target_type = non_none[0]
-            origin = getattr(target_type, '__origin__', None)
-    
-    if origin is list:
-        item_type = target_type.__args__[0] if target_type.__args__ else Any
-        return [_convert_value(item, item_type) for item in value]
-    
-    if origin is dict:
-        return value
-    
-    if is_dataclass(target_type) and isinstance(value, dict):
-        return load_dict(value, target_class=target_type)
-    
-    if target_type is datetime and isinstance(value, str):
-        return datetime.fromisoformat(value.replace('Z', '+00:00'))
-    
-    if target_type is date and isinstance(value, str):
-        return date.fromisoformat(value)
-    
-    return value
+    loader = _LOADERS.get(target_class)
+    if loader is None:
+        loader = _build_loader(target_class)
+    return loader(data)
 
 
 def create_instance(class_name: str, **kwargs) -> Any:
@@ -613,10 +1022,7 @@ def create_instance(class_name: str, **kwargs) -> Any:
     Example:
         user = create_instance("User", name="John", email="john@example.com")
     """
-    target_class = get_class(class_name)
-    if target_class is None:
-        raise ValueError(f"Unknown class: {{class_name}}. Available: {{list_classes()}}")
-    return target_class(**kwargs)
+    return _class_bundle(class_name).cls(**kwargs)
 
 
 # ============================================================================
@@ -647,12 +1053,11 @@ def to_json_file(obj: Any, file_path: Union[str, Path], indent: int = 2) -> None
         file_path: Output file path
         indent: JSON indentation
     """
-    file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path = os.fspath(file_path)
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
     
-    json_str = to_json_string(obj, indent=indent)
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(json_str)
+    with open(file_path, "wb") as f:
+        f.write(_dumps(to_dict(obj), indent))
 
 
 def to_json_string(obj: Any, indent: int = 2) -> str:
@@ -666,34 +1071,34 @@ def to_json_string(obj: Any, indent: int = 2) -> str:
     Returns:
         JSON string
     """
-    data = to_dict(obj)
-    return json.dumps(data, indent=indent, default=_json_serializer)
+    return _dumps(to_dict(obj), indent).decode("utf-8")
 
 
 def to_dict(obj: Any) -> Dict[str, Any]:
     """
     Convert a dataclass instance to a dictionary.
     
-    Uses the JSON property name mapping if available.
+    Uses the JSON property name mapping if available. Values are lowered
+    to JSON-native types: datetime/date to ISO strings, UUID and Decimal
+    to strings, Enum to its value.
+    
+    Raises:
+        TypeError: If a value has no JSON representation
     """
     if obj is None:
         return None
     
+    dumper = _DUMPERS.get(type(obj))
+    if dumper is not None:
+        return dumper(obj)
+    
     if is_dataclass(obj) and not isinstance(obj, type):
-        # Get JSON mapping if available
-        json_mapping = {{}}
-        if hasattr(obj, '_get_json_mapping'):
-            json_mapping = obj._get_json_mapping()
-        
-        result = {{}}
-        for field in fields(obj):
-            value = getattr(obj, field.name)
-            # Use JSON name if mapping exists
-            json_name = json_mapping.get(field.name, field.name)
-            result[json_name] = to_dict(value)
-        return result
-    
-    if isinstance(obj, list):
+        return _build_dumper(type(obj))(obj)
+    
+    if isinstance(obj, _PLAIN_TYPES):
+        return obj
+    
+    if isinstance(obj, (list, tuple)):
         return [to_dict(item) for item in obj]
     
     if isinstance(obj, dict):
@@ -702,104 +1107,107 @@ def to_dict(obj: Any) -> Dict[str, Any]:
     if isinstance(obj, (datetime, date)):
         return obj.isoformat()
     
-    return obj
-
-
-def _json_serializer(obj: Any) -> Any:
-    """Custom JSON serializer for special types."""
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    if hasattr(obj, '__dict__'):
-        return obj.__dict__
-    raise TypeError(f"Object of type {{type(obj)}} is not JSON serializable")
+    if isinstance(obj, Enum):
+        return to_dict(obj.value)
+    
+    if isinstance(obj, (UUID, Decimal)):
+        return str(obj)
+    
+    raise TypeError(f"Object of type {{type(obj).__name__}} is not JSON serializable")
 
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def list_classes() -> List[str]:
+def list_classes() -> Tuple[str, ...]:
     """
     List all available generated classes.
     
     Returns:
-        List of class names
+        Tuple of class names (shared; built once at import)
     """
-    return list(CLASS_REGISTRY.keys())
+    return _CLASS_NAMES
 
 
+@functools.lru_cache(maxsize=None)
 def get_class_info(class_name: str) -> Optional[Dict[str, Any]]:
     """
     Get information about a generated class.
     
+    The result is computed once per class name and shared between
+    callers, so treat it as read-only.
+    
     Args:
         class_name: Name of the class
         
     Returns:
         Dictionary with class information
     """
-    target_class = get_class(class_name)
-    if target_class is None:
-        return None
-    
-    if not is_dataclass(target_class):
+    try:
+        bundle = _class_bundle(class_name)
+    except (ValueError, TypeError):
         return None
     
+    target_class = bundle.cls
+    required_py = bundle.required_py_names
     field_info = []
     for field in fields(target_class):
-        has_default = field.default is not field.default_factory
         field_info.append({{
             "name": field.name,
             "type": str(field.type),
-            "required": not has_default and field.default_factory is field.default_factory,
+            "required": field.name in required_py,
         }})
     
     return {{
         "name": class_name,
         "fields": field_info,
         "docstring": target_class.__doc__,
+        "slots": "__slots__" in vars(target_class),
     }}
 
 
-def validate_data(data: Dict[str, Any], class_name: str) -> Dict[str, Any]:
+def validate_data(
+    data: Dict[str, Any],
+    class_name: str,
+    deep: bool = False,
+) -> Dict[str, Any]:
     """
     Validate data against a class structure.
     
     Args:
         data: Dictionary to validate
         class_name: Name of the target class
+        deep: Also try to instantiate the class from the data
         
     Returns:
         Dictionary with validation results
     """
-    target_class = get_class(class_name)
-    if target_class is None:
+    try:
+        bundle = _class_bundle(class_name)
+    except ValueError:
         return {{"valid": False, "errors": [f"Unknown class: {{class_name}}"]}}
+    except TypeError:
+        return {{"valid": False, "errors": ["Not a dataclass"]}}
     
     errors = []
     warnings = []
     
-    if not is_dataclass(target_class):
-        return {{"valid": False, "errors": ["Not a dataclass"]}}
+    if not isinstance(data, dict):
+        return {{"valid": False, "errors": [f"Expected a JSON object, got {{type(data).__name__}}"]}}
     
     # Check for required fields
-    for field in fields(target_class):
-        has_default = field.default is not field.default_factory
-        if not has_default and field.default_factory is field.default_factory:
-            # Required field
-            json_name = field.name
-            if hasattr(target_class, '_get_json_mapping'):
-                mapping = target_class._get_json_mapping()
-                json_name = mapping.get(field.name, field.name)
-            
-            if json_name not in data and field.name not in data:
+    if bundle.required_json_names - data.keys():
+        for json_name, py_name in bundle.required:
+            if json_name not in data and py_name not in data:
                 errors.append(f"Missing required field: {{json_name}}")
     
     # Try to instantiate
-    try:
-        load_dict(data, target_class)
-    except Exception as e:
-        errors.append(f"Instantiation error: {{e}}")
+    if deep:
+        try:
+            load_dict(data, bundle.cls)
+        except Exception as e:
+            errors.append(f"Instantiation error: {{e}}")
     
     return {{
         "valid": len(errors) == 0,
@@ -809,8 +1217,7 @@ def validate_data(data: Dict[str, Any], class_name: str) -> Dict[str, Any]:
 '''
         
         driver_path = self.module_dir / "driver.py"
-        with open(driver_path, 'w') as f:
-            f.write(driver_code)
+        driver_path.write_bytes(driver_code.encode("utf-8"))
         results["files_created"].append(str(driver_path))
     
     def _generate_main(self, results: Dict[str, Any]) -> None:
@@ -843,16 +1250,16 @@ Usage:
     sample = generate_sample("User")
 """
 
-import argparse
-import json
+import functools
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from dataclasses import fields, is_dataclass
-import random
-import string
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from dataclasses import is_dataclass
 from datetime import datetime, date
-from uuid import uuid4
+
+# argparse, random, string and uuid are only needed by the CLI and sample
+# generation, so they are imported there to keep library imports light.
 
 from .driver import (
     load_json,
@@ -866,6 +1273,10 @@ from .driver import (
     get_class_info,
     create_instance,
     validate_data,
+    _dumps,
+    _get_meta,
+    _loads,
+    _strip_optional,
 )
 from .generated import CLASS_REGISTRY, get_class
 
@@ -958,7 +1369,7 @@ def generate_sample(
     
     Args:
         class_name: Name of the class
-        seed: Random seed for reproducibility
+        seed: Seed for the sample generator (the global random state is untouched)
         
     Returns:
         Instance with sample data
@@ -967,9 +1378,31 @@ def generate_sample(
         sample_user = generate_sample("User")
         print(sample_user.name)
     """
+    return generate_sample_for_class(_resolve_dataclass(class_name), seed=seed)
+
+
+def generate_sample_for_class(target_class: type, seed: Optional[int] = None) -> Any:
+    """
+    Generate a sample instance of an already-resolved dataclass.
+    
+    Use this instead of generate_sample() when creating many samples of
+    one class, so the name lookup and dataclass check happen only once.
+    
+    Args:
+        target_class: The dataclass to instantiate
+        seed: Seed for the sample generator (the global random state is untouched)
+        
+    Returns:
+        Instance with sample data
+    """
     if seed is not None:
-        random.seed(seed)
+        _get_rng().seed(seed)
     
+    return _build_sample(target_class)
+
+
+def _resolve_dataclass(class_name: str) -> type:
+    """Look up a generated class by name, raising if it is unknown or not a dataclass."""
     target_class = get_class(class_name)
     if target_class is None:
         raise ValueError(f"Unknown class: {{class_name}}. Available: {{list_classes()}}")
@@ -977,101 +1410,217 @@ def generate_sample(
     if not is_dataclass(target_class):
         raise TypeError(f"{{class_name}} is not a dataclass")
     
-    sample_data = {{}}
-    for field in fields(target_class):
-        sample_data[field.name] = _generate_sample_value(field.type, field.name)
+    return target_class
+
+
+# Generator for one field: called with no arguments, returns a sample value
+SampleGenerator = Callable[[], Any]
+
+# Dataclasses whose sample is being built right now, see _build_sample()
+_SAMPLES_IN_PROGRESS: Set[type] = set()
+
+# Value pools for sample data, allocated once
+_SAMPLE_NAMES = ("John", "Jane", "Bob", "Alice", "Charlie", "Diana")
+_SAMPLE_CITIES = ("New York", "Los Angeles", "Chicago", "Houston", "Phoenix")
+_SAMPLE_COUNTRIES = ("US", "UK", "CA", "AU", "DE", "FR")
+_SAMPLE_BOOLS = (True, False)
+
+# Version 4 / RFC 4122 variant bits for sample UUIDs
+_UUID4_MASK = ~((0xF << 76) | (0x3 << 62)) & ((1 << 128) - 1)
+_UUID4_BITS = (0x4 << 76) | (0x2 << 62)
+
+# Field-name keywords per sample kind, in priority order: the first kind
+# with a keyword contained in the lower-cased field name wins
+_STR_KEYWORDS = (
+    ("email", ("email",)),
+    ("name", ("name",)),
+    ("uuid", ("id", "uuid")),
+    ("url", ("url", "uri")),
+    ("phone", ("phone",)),
+    ("address", ("address",)),
+    ("city", ("city",)),
+    ("country", ("country",)),
+    ("title", ("title",)),
+    ("description", ("description",)),
+)
+_INT_KEYWORDS = (
+    ("age", ("age",)),
+    ("year", ("year",)),
+    ("count", ("count", "quantity")),
+    ("amount", ("price", "amount")),
+)
+_FLOAT_KEYWORDS = (
+    ("amount", ("price", "amount")),
+    ("rate", ("rate", "percentage")),
+)
+
+
+def _keyword_kind(name_lower: str, table: Tuple[Tuple[str, Tuple[str, ...]], ...], default: str) -> str:
+    """Find the sample kind for a field name from a keyword table."""
+    for kind, keywords in table:
+        for keyword in keywords:
+            if keyword in name_lower:
+                return kind
+    return default
+
+
+@functools.lru_cache(maxsize=None)
+def _sample_plan(cls: type) -> Tuple[Tuple[str, SampleGenerator], ...]:
+    """
+    Build the sample-generation plan for a dataclass once.
     
-    return target_class(**sample_data)
+    Each field's type (resolved through the driver's class metadata) and
+    name keywords are inspected here, so generating a sample only calls
+    the prebuilt per-field generators.
+    """
+    return tuple(
+        (name, _make_sample_generator(field_type, name))
+        for name, field_type in _get_meta(cls).field_types.items()
+    )
 
 
-def _generate_sample_value(field_type: Any, field_name: str) -> Any:
-    """Generate a sample value for a field."""
-    origin = getattr(field_type, '__origin__', None)
+@functools.lru_cache(maxsize=None)
+def _get_rng() -> Any:
+    """Get the random.Random instance used for samples, created on first use."""
+    import random
+    return random.Random()
+
+
+@functools.lru_cache(maxsize=None)
+def _sample_factory(cls: type) -> Callable[[], Any]:
+    """
+    Compile a sample factory function specialized for one dataclass.
     
-    # Handle Optional
-    if origin is Union:
-        args = field_type.__args__
-        non_none = [t for t in args if t is not type(None)]
-        if non_none:
-            field_type = non_none[0]
-            origin = getattr(field_type, '__origin__', None)
-        else:
-            return None
+    The generated source calls the class with one keyword argument per
+    field, each bound directly to that field's generator from the sample
+    plan, so no per-sample dict or plan iteration is needed.
+    """
+    namespace: Dict[str, Any] = {{"_cls": cls}}
+    arguments = []
+    for index, (name, generate) in enumerate(_sample_plan(cls)):
+        namespace[f"_g{{index}}"] = generate
+        arguments.append(f"{{name}}=_g{{index}}()")
+    
+    source = f"def _sample_{{cls.__name__}}():\\n    return _cls({{', '.join(arguments)}})"
+    exec(source, namespace)
+    return namespace[f"_sample_{{cls.__name__}}"]
+
+
+def _sample_uuid(rng: Any) -> str:
+    """
+    Format a version-4 UUID string from the sample RNG.
+    
+    Unlike uuid4() this skips os.urandom and the UUID object, and it
+    follows the --seed like every other sample value.
+    """
+    digits = "%032x" % (rng.getrandbits(128) & _UUID4_MASK | _UUID4_BITS)
+    return f"{{digits[:8]}}-{{digits[8:12]}}-{{digits[12:16]}}-{{digits[16:20]}}-{{digits[20:]}}"
+
+
+def _build_sample(cls: type) -> Any:
+    """
+    Create an instance of a dataclass from its compiled sample factory.
+    
+    The class is recorded in _SAMPLES_IN_PROGRESS while its fields are
+    generated, so a field that refers back to it is left empty instead of
+    recursing forever.
+    """
+    _SAMPLES_IN_PROGRESS.add(cls)
+    try:
+        return _sample_factory(cls)()
+    finally:
+        _SAMPLES_IN_PROGRESS.discard(cls)
+
+
+def _str_sample_generator(rng: Any, name_lower: str) -> SampleGenerator:
+    """Choose a string generator from field-name keywords."""
+    import string
+    
+    generators = {{
+        "email": lambda: f"user{{rng.randint(1, 999)}}@example.com",
+        "name": lambda: rng.choice(_SAMPLE_NAMES),
+        "uuid": lambda: _sample_uuid(rng),
+        "url": lambda: "https://example.com/resource",
+        "phone": lambda: f"+1-555-{{rng.randint(100, 999)}}-{{rng.randint(1000, 9999)}}",
+        "address": lambda: f"{{rng.randint(1, 999)}} Main Street",
+        "city": lambda: rng.choice(_SAMPLE_CITIES),
+        "country": lambda: rng.choice(_SAMPLE_COUNTRIES),
+        "title": lambda: f"Sample Title {{rng.randint(1, 100)}}",
+        "description": lambda: "This is a sample description for testing purposes.",
+        "text": lambda: ''.join(rng.choices(string.ascii_letters, k=10)),
+    }}
+    return generators[_keyword_kind(name_lower, _STR_KEYWORDS, "text")]
+
+
+def _int_sample_generator(rng: Any, name_lower: str) -> SampleGenerator:
+    """Choose an integer generator from field-name keywords."""
+    generators = {{
+        "age": lambda: rng.randint(18, 80),
+        "year": lambda: rng.randint(2020, 2025),
+        "count": lambda: rng.randint(1, 100),
+        "amount": lambda: rng.randint(1, 10000),
+        "number": lambda: rng.randint(1, 1000),
+    }}
+    return generators[_keyword_kind(name_lower, _INT_KEYWORDS, "number")]
+
+
+def _float_sample_generator(rng: Any, name_lower: str) -> SampleGenerator:
+    """Choose a float generator from field-name keywords."""
+    # Whole cents drawn as integers: same 0.01 grid as rounding a uniform float
+    generators = {{
+        "amount": lambda: rng.randint(100, 100000) / 100,
+        "rate": lambda: rng.randint(0, 10000) / 100,
+        "number": lambda: rng.randint(0, 10000) / 100,
+    }}
+    return generators[_keyword_kind(name_lower, _FLOAT_KEYWORDS, "number")]
+
+
+# Generator factories for scalar field types, called as factory(rng, name_lower)
+_SCALAR_SAMPLE_GENERATORS: Dict[Any, Callable[[Any, str], SampleGenerator]] = {{
+    str: _str_sample_generator,
+    int: _int_sample_generator,
+    float: _float_sample_generator,
+    bool: lambda rng, name_lower: lambda: rng.choice(_SAMPLE_BOOLS),
+    datetime: lambda rng, name_lower: datetime.now,
+    date: lambda rng, name_lower: date.today,
+}}
+
+
+def _make_sample_generator(field_type: Any, field_name: str) -> SampleGenerator:
+    """Choose the generator for a field from its type and name."""
+    rng = _get_rng()
+    field_type = _strip_optional(field_type)
+    origin = getattr(field_type, '__origin__', None)
     
     # Handle List
     if origin is list:
-        item_type = field_type.__args__[0] if field_type.__args__ else str
-        return [_generate_sample_value(item_type, field_name) for _ in range(random.randint(1, 3))]
+        args = getattr(field_type, '__args__', None)
+        item_type = _strip_optional(args[0]) if args else str
+        item_generator = _make_sample_generator(item_type, field_name)
+        if isinstance(item_type, type) and is_dataclass(item_type):
+            # A list of a class being built is left empty, ending the recursion
+            return lambda: [] if item_type in _SAMPLES_IN_PROGRESS else [
+                item_generator() for _ in range(rng.randint(1, 3))
+            ]
+        return lambda: [item_generator() for _ in range(rng.randint(1, 3))]
     
     # Handle Dict
     if origin is dict:
-        return {{"key": "value"}}
-    
-    # Handle basic types
-    name_lower = field_name.lower()
-    
-    if field_type is str or field_type == 'str':
-        if 'email' in name_lower:
-            return f"user{{random.randint(1, 999)}}@example.com"
-        elif 'name' in name_lower:
-            return random.choice(["John", "Jane", "Bob", "Alice", "Charlie", "Diana"])
-        elif 'id' in name_lower or 'uuid' in name_lower:
-            return str(uuid4())
-        elif 'url' in name_lower or 'uri' in name_lower:
-            return "https://example.com/resource"
-        elif 'phone' in name_lower:
-            return f"+1-555-{{random.randint(100, 999)}}-{{random.randint(1000, 9999)}}"
-        elif 'address' in name_lower:
-            return f"{{random.randint(1, 999)}} Main Street"
-        elif 'city' in name_lower:
-            return random.choice(["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"])
-        elif 'country' in name_lower:
-            return random.choice(["US", "UK", "CA", "AU", "DE", "FR"])
-        elif 'title' in name_lower:
-            return f"Sample Title {{random.randint(1, 100)}}"
-        elif 'description' in name_lower:
-            return "This is a sample description for testing purposes."
-        else:
-            return ''.join(random.choices(string.ascii_letters, k=10))
-    
-    if field_type is int or field_type == 'int':
-        if 'age' in name_lower:
-            return random.randint(18, 80)
-        elif 'year' in name_lower:
-            return random.randint(2020, 2025)
-        elif 'count' in name_lower or 'quantity' in name_lower:
-            return random.randint(1, 100)
-        elif 'price' in name_lower or 'amount' in name_lower:
-            return random.randint(1, 10000)
-        else:
-            return random.randint(1, 1000)
-    
-    if field_type is float or field_type == 'float':
-        if 'price' in name_lower or 'amount' in name_lower:
-            return round(random.uniform(1.0, 1000.0), 2)
-        elif 'rate' in name_lower or 'percentage' in name_lower:
-            return round(random.uniform(0.0, 100.0), 2)
-        else:
-            return round(random.uniform(0.0, 100.0), 2)
-    
-    if field_type is bool or field_type == 'bool':
-        return random.choice([True, False])
+        return lambda: {{"key": "value"}}
     
-    if field_type is datetime:
-        return datetime.now()
-    
-    if field_type is date:
-        return date.today()
+    # Handle basic types with one table lookup
+    factory = _SCALAR_SAMPLE_GENERATORS.get(field_type)
+    if factory is not None:
+        return factory(rng, field_name.lower())
     
-    # Handle nested dataclass
-    if is_dataclass(field_type):
-        nested_data = {{}}
-        for f in fields(field_type):
-            nested_data[f.name] = _generate_sample_value(f.type, f.name)
-        return field_type(**nested_data)
+    # Handle nested dataclass; its plan is looked up on use so that
+    # self-referencing classes do not recurse while planning, and a field
+    # that re-enters a class still being built gets None
+    if isinstance(field_type, type) and is_dataclass(field_type):
+        return lambda: None if field_type in _SAMPLES_IN_PROGRESS else _build_sample(field_type)
     
     # Default
-    return None
+    return lambda: None
 
 
 def convert_json(
@@ -1080,19 +1629,28 @@ def convert_json(
     class_name: str,
     indent: int = 2,
     verbose: bool = False,
+    fast: bool = False,
 ) -> Any:
     """
     Load JSON, parse to class, and save back (useful for validation/normalization).
     
+    With fast=True the data is only parsed to a dict, checked with
+    validate_data() and written back as-is, skipping the dataclass round
+    trip. Values are not normalized and unknown properties are kept.
+    
     Args:
         input_path: Input JSON file path
         output_path: Output JSON file path
         class_name: Name of the class
         indent: JSON indentation
         verbose: Print progress
+        fast: Validate and rewrite the dict without building an instance
         
     Returns:
-        The parsed instance
+        The parsed instance, or None when fast=True
+        
+    Raises:
+        ValueError: If fast=True and the data does not validate
         
     Example:
         # Validate and normalize JSON through the class
@@ -1101,12 +1659,29 @@ def convert_json(
     if verbose:
         print(f"Loading {{input_path}}...")
     
-    instance = load_json(input_path, class_name)
+    if fast:
+        with open(input_path, "rb") as f:
+            data = _loads(f.read())
+        
+        result = validate_data(data, class_name)
+        if not result["valid"]:
+            raise ValueError(
+                f"Invalid {{class_name}} data in {{input_path}}: " + "; ".join(result["errors"])
+            )
+        instance = None
+    else:
+        instance = load_json(input_path, class_name)
     
     if verbose:
         print(f"Saving to {{output_path}}...")
     
-    to_json_file(instance, output_path, indent=indent)
+    if fast:
+        output_path = os.fspath(output_path)
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        with open(output_path, "wb") as f:
+            f.write(_dumps(data, indent))
+    else:
+        to_json_file(instance, output_path, indent=indent)
     
     if verbose:
         print(f"Successfully converted {{class_name}}")
@@ -1114,10 +1689,143 @@ def convert_json(
     return instance
 
 
+# sample -j only fans out to worker processes from this many samples up
+PARALLEL_SAMPLE_MIN_COUNT = 1000
+
+# Buffered --jsonl sample output is written out in chunks of about this size
+JSONL_FLUSH_BYTES = 64 * 1024
+
+def _sample_chunk(class_name: str, start: int, count: int, seed: Optional[int], jsonl: bool) -> Any:
+    """
+    Generate samples start..start+count-1 in a worker process.
+    
+    Per-sample seeds follow the sequential CLI (seed + index), so seeded
+    output does not depend on the number of workers. Returns JSONL bytes,
+    or a list of dicts for array output.
+    """
+    target_class = _resolve_dataclass(class_name)
+    if not seed:
+        # Forked workers would otherwise share the parent's random state
+        _get_rng().seed()
+    
+    records = [
+        to_dict(generate_sample_for_class(target_class, seed=seed + i if seed else None))
+        for i in range(start, start + count)
+    ]
+    if jsonl:
+        return b"".join(_dumps(record, None) + b"\\n" for record in records)
+    return records
+
+
+def _map_sample_chunks(class_name: str, count: int, seed: Optional[int], jsonl: bool, workers: int):
+    """Split a sample run across worker processes, yielding chunk results in order."""
+    from concurrent.futures import ProcessPoolExecutor
+    
+    size = -(-count // workers)
+    starts = range(0, count, size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            _sample_chunk,
+            [class_name] * len(starts),
+            starts,
+            [min(size, count - start) for start in starts],
+            [seed] * len(starts),
+            [jsonl] * len(starts),
+        )
+
+
+# Files larger than this are stream-parsed by the validate command (needs ijson)
+STREAM_VALIDATE_MIN_BYTES = 8 * 1024 * 1024
+
+
+def _load_for_validation(file_path: Union[str, Path], class_name: str) -> Any:
+    """
+    Load a JSON file for validation against a class.
+    
+    Large top-level objects are stream-parsed with ijson when it is
+    installed, keeping only the properties the class knows about, since
+    validation ignores everything else. Other files are parsed whole.
+    """
+    file_path = os.fspath(file_path)
+    target_class = get_class(class_name)
+    
+    if target_class is not None and is_dataclass(target_class) and \\
+            os.path.getsize(file_path) > STREAM_VALIDATE_MIN_BYTES:
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+        
+        if ijson is not None:
+            with open(file_path, "rb") as f:
+                # Arrays and scalars are reported by validate_data as-is
+                first = f.read(64).lstrip()[:1]
+                if first == b"{{":
+                    f.seek(0)
+                    meta = _get_meta(target_class)
+                    known = set(meta.field_types) | set(meta.py_to_json.values())
+                    return {{
+                        key: value
+                        for key, value in ijson.kvitems(f, "", use_float=True)
+                        if key in known
+                    }}
+    
+    with open(file_path, "rb") as f:
+        return _loads(f.read())
+
+
 # ============================================================================
 # COMMAND-LINE INTERFACE
 # ============================================================================
 
+def _print_class_list() -> int:
+    """Print the available classes for the list command."""
+    print("Available classes:")
+    for name in sorted(list_classes()):
+        print(f"  - {{name}}")
+    return 0
+
+
+def _print_class_info(class_name: str) -> int:
+    """Print class details for the info command."""
+    try:
+        info = get_class_info(class_name)
+    except Exception as e:
+        print(f"Error: {{e}}", file=sys.stderr)
+        return 1
+    if info is None:
+        print(f"Unknown class: {{class_name}}")
+        return 1
+    print(f"Class: {{info['name']}}")
+    print(f"Docstring: {{info['docstring'] or 'N/A'}}")
+    print(f"Slots: {{'yes' if info.get('slots') else 'no (regenerate with --slots on Python 3.10+)'}}")
+    print("Fields:")
+    for f in info['fields']:
+        req = " (required)" if f.get('required') else ""
+        print(f"  - {{f['name']}}: {{f['type']}}{{req}}")
+    return 0
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write JSON bytes and a newline to stdout without decoding them to str first."""
+    sys.stdout.flush()
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # Replaced text-only streams (e.g. redirect_stdout) have no binary buffer
+        print(data.decode("utf-8"))
+        return
+    out.write(data)
+    out.write(b"\\n")
+    out.flush()
+
+
+def _sample_workers(parsed: Any) -> int:
+    """Number of worker processes for a sample run (1 means generate in-process)."""
+    if parsed.count < PARALLEL_SAMPLE_MIN_COUNT:
+        return 1
+    return parsed.workers or os.cpu_count() or 1
+
+
 def run_cli(args: Optional[List[str]] = None) -> int:
     """
     Run the command-line interface.
@@ -1128,6 +1836,17 @@ def run_cli(args: Optional[List[str]] = None) -> int:
     Returns:
         Exit code (0 for success)
     """
+    if args is None:
+        args = sys.argv[1:]
+    
+    # Flag-free list/info invocations skip building the argparse parser
+    if args == ["list"]:
+        return _print_class_list()
+    if len(args) == 2 and args[0] == "info" and not args[1].startswith("-"):
+        return _print_class_info(args[1])
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         prog="{self.module_name}",
         description="Generated Data Models - Load, create, and manipulate JSON data",
@@ -1146,6 +1865,7 @@ Examples:
   Generate sample data:
     python -m {self.module_name} sample User
     python -m {self.module_name} sample User -o sample_user.json
+    python -m {self.module_name} sample User -n 1000 --jsonl -o users.jsonl
     
   Validate JSON against class:
     python -m {self.module_name} validate user.json User
@@ -1177,6 +1897,14 @@ Copyright (C) 2025-2030, Ashutosh Sinha. All Rights Reserved.
     sample_parser.add_argument("-o", "--output", help="Output file (optional)")
     sample_parser.add_argument("-n", "--count", type=int, default=1, help="Number of samples")
     sample_parser.add_argument("--seed", type=int, help="Random seed")
+    sample_parser.add_argument(
+        "--jsonl", action="store_true",
+        help="Write one compact JSON object per line as samples are generated",
+    )
+    sample_parser.add_argument(
+        "-j", "--workers", type=int, default=1,
+        help=f"Processes used when --count is at least {{PARALLEL_SAMPLE_MIN_COUNT}} (default: 1, 0 for one per CPU)",
+    )
     
     # Validate command
     validate_parser = subparsers.add_parser("validate", help="Validate JSON against class")
@@ -1191,58 +1919,79 @@ Copyright (C) 2025-2030, Ashutosh Sinha. All Rights Reserved.
     
     try:
         if parsed.command == "list":
-            print("Available classes:")
-            for name in sorted(list_classes()):
-                print(f"  - {{name}}")
-            return 0
+            return _print_class_list()
         
         elif parsed.command == "info":
-            info = get_class_info(parsed.class_name)
-            if info is None:
-                print(f"Unknown class: {{parsed.class_name}}")
-                return 1
-            print(f"Class: {{info['name']}}")
-            print(f"Docstring: {{info['docstring'] or 'N/A'}}")
-            print("Fields:")
-            for f in info['fields']:
-                req = " (required)" if f.get('required') else ""
-                print(f"  - {{f['name']}}: {{f['type']}}{{req}}")
-            return 0
+            return _print_class_info(parsed.class_name)
         
         elif parsed.command == "load":
             instance = load_and_parse(parsed.file, parsed.class_name, verbose=True)
-            json_str = to_json_string(instance)
+            json_bytes = _dumps(to_dict(instance))
             if parsed.output:
-                with open(parsed.output, "w") as f:
-                    f.write(json_str)
+                with open(parsed.output, "wb") as f:
+                    f.write(json_bytes)
                 print(f"Saved to {{parsed.output}}")
             else:
-                print(json_str)
+                _write_stdout(json_bytes)
+            return 0
+        
+        elif parsed.command == "sample" and parsed.jsonl:
+            # Stream samples so memory stays flat regardless of --count
+            target_class = _resolve_dataclass(parsed.class_name)
+            workers = _sample_workers(parsed)
+            out = open(parsed.output, "wb") if parsed.output else sys.stdout.buffer
+            buffer = bytearray()
+            extend = buffer.extend
+            try:
+                if workers > 1:
+                    for chunk in _map_sample_chunks(parsed.class_name, parsed.count, parsed.seed, True, workers):
+                        out.write(chunk)
+                else:
+                    for i in range(parsed.count):
+                        seed = parsed.seed + i if parsed.seed else None
+                        extend(_dumps(to_dict(generate_sample_for_class(target_class, seed=seed)), None))
+                        extend(b"\\n")
+                        if len(buffer) >= JSONL_FLUSH_BYTES:
+                            out.write(buffer)
+                            buffer.clear()
+                    out.write(buffer)
+            finally:
+                if parsed.output:
+                    out.close()
+                else:
+                    out.flush()
+            if parsed.output:
+                print(f"Generated {{parsed.count}} sample(s) to {{parsed.output}}")
             return 0
         
         elif parsed.command == "sample":
-            samples = []
-            for i in range(parsed.count):
-                seed = parsed.seed + i if parsed.seed else None
-                samples.append(generate_sample(parsed.class_name, seed=seed))
-            
-            if parsed.count == 1:
-                json_str = to_json_string(samples[0])
+            target_class = _resolve_dataclass(parsed.class_name)
+            workers = _sample_workers(parsed)
+            if workers > 1:
+                chunks = _map_sample_chunks(parsed.class_name, parsed.count, parsed.seed, False, workers)
+                json_bytes = _dumps([record for chunk in chunks for record in chunk])
             else:
-                json_str = json.dumps([to_dict(s) for s in samples], indent=2, default=str)
+                samples = []
+                for i in range(parsed.count):
+                    seed = parsed.seed + i if parsed.seed else None
+                    samples.append(generate_sample_for_class(target_class, seed=seed))
+                
+                if parsed.count == 1:
+                    json_bytes = _dumps(to_dict(samples[0]))
+                else:
+                    json_bytes = _dumps([to_dict(s) for s in samples])
             
             if parsed.output:
-                with open(parsed.output, "w") as f:
-                    f.write(json_str)
+                with open(parsed.output, "wb") as f:
+                    f.write(json_bytes)
                 print(f"Generated {{parsed.count}} sample(s) to {{parsed.output}}")
             else:
-                print(json_str)
+                _write_stdout(json_bytes)
             return 0
         
         elif parsed.command == "validate":
-            with open(parsed.file, "r") as f:
-                data = json.load(f)
-            result = validate_data(data, parsed.class_name)
+            data = _load_for_validation(parsed.file, parsed.class_name)
+            result = validate_data(data, parsed.class_name, deep=True)
             if result["valid"]:
                 print(f"[OK] {{parsed.file}} is valid for {{parsed.class_name}}")
             else:
@@ -1263,8 +2012,7 @@ if __name__ == "__main__":
 '''
         
         main_path = self.module_dir / "main.py"
-        with open(main_path, 'w') as f:
-            f.write(main_code)
+        main_path.write_bytes(main_code.encode("utf-8"))
         results["files_created"].append(str(main_path))
     
     def _generate_main_entry(self, results: Dict[str, Any]) -> None:
@@ -1286,17 +2034,50 @@ if __name__ == "__main__":
 '''
         
         main_entry_path = self.module_dir / "__main__.py"
-        with open(main_entry_path, 'w') as f:
-            f.write(main_entry_code)
+        main_entry_path.write_bytes(main_entry_code.encode("utf-8"))
         results["files_created"].append(str(main_entry_path))
 
 
+def _generate_schema_code(
+    schema: Dict[str, Any],
+    class_name: str,
+    base_uri: str,
+    all_fields_optional: bool,
+    use_slots: bool,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Generate dataclass code for a single schema.
+    
+    Module-level so it can run in a worker process. Errors are returned
+    rather than raised so one bad schema does not abort the others.
+    
+    Returns:
+        Tuple of (code, error message)
+    """
+    try:
+        processor = SchemaProcessor(
+            schema,
+            root_class_name=class_name,
+            base_uri=base_uri,
+        )
+        code = processor.generate_code(
+            style="dataclass",
+            all_fields_optional=all_fields_optional,
+            use_slots=use_slots,
+        )
+        return code, None
+    except Exception as e:
+        return None, str(e)
+
+
 def generate_module(
     schema_dir: str,
     output_dir: str,
     module_name: Optional[str] = None,
     overwrite: bool = True,
     all_fields_optional: bool = True,
+    use_slots: bool = False,
+    max_workers: Optional[int] = 1,
 ) -> Dict[str, Any]:
     """
     Generate a Python module from a folder of JSON Schema files.
@@ -1313,6 +2094,9 @@ def generate_module(
         module_name: Name for the module (default: "mymodule")
         overwrite: Whether to overwrite existing files (default: True)
         all_fields_optional: If True, all fields get defaults allowing empty constructor (default: True)
+        use_slots: If True, generated dataclasses use __slots__ on Python 3.10+
+        max_workers: Processes used to generate schema code in parallel
+            (default: 1, sequential; None uses one per CPU)
         
     Returns:
         Dictionary with generation results:
@@ -1351,6 +2135,8 @@ def generate_module(
         module_name=module_name,
         overwrite=overwrite,
         all_fields_optional=all_fields_optional,
+        use_slots=use_slots,
+        max_workers=max_workers,
     )
     
     return generator.generate()
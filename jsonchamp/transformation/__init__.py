@@ -39,6 +39,13 @@ Example usage:
 
 __version__ = "1.7.0"
 
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Union
+
 from .engine.transformer import SchemaMapTransformer, TransformError
 from .engine.evaluator import ExpressionEvaluator, ExternalFunctionError
 from .engine.functions import BuiltinFunctions
@@ -56,7 +63,7 @@ from .parser.parser import (
     FunctionDefinition
 )
 from .compiler.python_gen import PythonCodeGenerator
-from .utils.validation import validate_json_schema, ValidationError
+from .utils.validation import validate_json_schema, load_schema_validator, ValidationError
 
 # Converters for CSV, XML, and FLR support
 from .converters import (
@@ -99,6 +106,7 @@ __all__ = [
     "PythonCodeGenerator",
     # Validation
     "validate_json_schema",
+    "load_schema_validator",
     "ValidationError",
     # CSV Converters
     "CSVConverter",
@@ -165,17 +173,73 @@ def transform(source_data: dict, mapping_file: str, validate_schema: str = None,
     return result
 
 
-def load_mapping(mapping_file: str) -> SchemaMapTransformer:
+def load_mapping(mapping_file: str, cache_dir: Union[str, Path] = None) -> SchemaMapTransformer:
     """
     Load a SchemaMap mapping file and return a transformer.
     
     Args:
         mapping_file: Path to the .smap mapping file
+        cache_dir: Optional directory for caching the parsed mapping. The
+            parsed AST is pickled there, keyed by the file's path, size and
+            modification time, and reused by later loads (in any process)
+            while the file is unchanged.
         
     Returns:
         SchemaMapTransformer instance ready for transformations
     """
-    return SchemaMapTransformer.from_file(mapping_file)
+    if cache_dir is None:
+        return SchemaMapTransformer.from_file(mapping_file)
+    return SchemaMapTransformer(_load_parsed_mapping(mapping_file, Path(cache_dir)))
+
+
+def _parser_fingerprint() -> str:
+    """
+    Hash of the lexer and parser sources.
+    
+    Part of the parsed-mapping cache key, so pickled ASTs are rebuilt when
+    the parser or its AST classes change, even without a version bump.
+    """
+    digest = hashlib.sha256()
+    for cls in (SchemaMapLexer, SchemaMapParser):
+        with open(sys.modules[cls.__module__].__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _load_parsed_mapping(mapping_file: str, cache_dir: Path) -> MappingFile:
+    """Parse a mapping file, going through the pickled copy in cache_dir."""
+    stat = os.stat(mapping_file)
+    key = hashlib.sha256(repr((
+        __version__, _parser_fingerprint(), os.path.abspath(mapping_file),
+        stat.st_size, stat.st_mtime_ns
+    )).encode('utf-8')).hexdigest()
+    cache_path = cache_dir / f"{key}.pkl"
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # A missing, truncated or incompatible entry is simply rebuilt
+        pass
+    
+    with open(mapping_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    mapping = SchemaMapParser().parse(content, filename=str(mapping_file))
+    
+    # The cache is an optimization only; an unwritable directory or a
+    # mapping that cannot be pickled just leaves it unused
+    tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(mapping, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return mapping
 
 
 def compile_mapping(mapping_file: str, output_format: str = "python", 
@@ -436,18 +500,16 @@ def compile_and_transform(source_data: any, mapping_file: str,
             transformer.register_function(name, func)
     
     if isinstance(source_data, list):
-        if hasattr(transformer, 'transform_batch'):
-            results = transformer.transform_batch(source_data)
-        else:
-            results = [transformer.transform(item) for item in source_data]
+        results = transformer.transform_batch(source_data)
     else:
         results = transformer.transform(source_data)
     
     if validate_schema:
+        validate = load_schema_validator(validate_schema)
         if isinstance(results, list):
             for result in results:
-                validate_json_schema(result, validate_schema)
+                validate(result)
         else:
-            validate_json_schema(results, validate_schema)
+            validate(results)
     
     return results
@@ -8,7 +8,7 @@ Compiles SchemaMap DSL to optimized, standalone Python code.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from ..parser.parser import (
@@ -24,8 +24,21 @@ class PythonCodeGenerator:
         self.class_name = class_name
         self._lookups: Dict[str, Any] = {}
         self._aliases: Dict[str, AliasDefinition] = {}
+        # Prefix for helper-method calls in generated mapping code; empty
+        # when generating transform_batch, which binds them to locals
+        self._call_prefix = "self."
+        # Example record whose shape source reads are specialized for
+        self._specimen: Optional[Dict[str, Any]] = None
     
-    def generate(self, mapping_file: MappingFile) -> str:
+    def generate(self, mapping_file: MappingFile, specimen: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Generate transformer source code for a parsed mapping file.
+        
+        With a specimen record, source paths it contains are read with
+        direct subscripts, falling back to the generic path lookup for
+        records of a different shape.
+        """
+        self._specimen = specimen
         self._lookups = {}
         self._aliases = mapping_file.aliases
         
@@ -38,6 +51,11 @@ class PythonCodeGenerator:
         
         lookup_code = self._gen_lookup_dict()
         mapping_code = self._gen_mappings(mapping_file.mappings)
+        try:
+            self._call_prefix = ""
+            batch_mapping_code = self._gen_mappings(mapping_file.mappings, indent=12)
+        finally:
+            self._call_prefix = "self."
         
         source_file = mapping_file.source_file or "unknown"
         
@@ -54,6 +72,13 @@ from datetime import datetime
 from typing import Any, Dict, List, Callable
 
 
+def _list_item(value: Any, index: int) -> Any:
+    # Specialized reads index lists only, as _get_value does
+    if isinstance(value, list):
+        return value[index]
+    raise TypeError("not a list")
+
+
 class {self.class_name}:
     """Compiled SchemaMap Transformer."""
 
@@ -76,7 +101,24 @@ class {self.class_name}:
         return target
 
     def transform_batch(self, items: List[Dict]) -> List[Dict]:
-        return [self.transform(item) for item in items]
+        # Same mappings as transform(), with helper methods bound once per batch
+        _get_value = self._get_value
+        _set_value = self._set_value
+        _apply_transform = self._apply_transform
+        _evaluate_expr = self._evaluate_expr
+        _lookup = self._lookup
+        omit_nulls = self._null_handling == "omit"
+        results: List[Dict[str, Any]] = []
+        append = results.append
+        for source in items:
+            target: Dict[str, Any] = {{}}
+            
+{batch_mapping_code}
+            
+            if omit_nulls:
+                target = self._remove_nulls(target)
+            append(target)
+        return results
 
     def _get_value(self, data: Any, path: str) -> Any:
         if not path or data is None:
@@ -234,14 +276,21 @@ if __name__ == "__main__":
         source_code = self._gen_source(mapping.source)
         is_array = "[*]" in str(mapping.source)
         
-        lines.append(f"{ind}_v = {source_code}")
+        direct_code = self._gen_direct_access(str(mapping.source)) if isinstance(mapping.source, SourcePath) else None
+        if direct_code:
+            lines.append(f"{ind}try:")
+            lines.append(f"{ind}    _v = {direct_code}")
+            lines.append(f"{ind}except (KeyError, IndexError, TypeError):")
+            lines.append(f"{ind}    _v = {source_code}")
+        else:
+            lines.append(f"{ind}_v = {source_code}")
         
         # Apply transforms
         for t in mapping.transforms.transforms:
             t_code = self._gen_transform(t, is_array)
             lines.append(f"{ind}_v = {t_code}")
         
-        lines.append(f'{ind}self._set_value(target, "{target_path}", _v)')
+        lines.append(f'{ind}{self._call_prefix}_set_value(target, "{target_path}", _v)')
         lines.append("")
         
         return lines
@@ -257,7 +306,7 @@ if __name__ == "__main__":
                 return "str(uuid.uuid4())"
             else:
                 expr = source.expression.replace('"', '\\"')
-                return f'self._evaluate_expr("{expr}", source)'
+                return f'{self._call_prefix}_evaluate_expr("{expr}", source)'
         
         if isinstance(source, MergeExpression):
             if source.operator == "+":
@@ -266,14 +315,48 @@ if __name__ == "__main__":
                     if isinstance(p, str):
                         parts.append(repr(p))
                     elif isinstance(p, SourcePath):
-                        parts.append(f'str(self._get_value(source, "{p}") or "")')
+                        parts.append(f'str({self._call_prefix}_get_value(source, "{p}") or "")')
                 return "(" + " + ".join(parts) + ")"
         
         if isinstance(source, SourcePath):
-            return f'self._get_value(source, "{source}")'
+            return f'{self._call_prefix}_get_value(source, "{source}")'
         
         return "None"
     
+    def _gen_direct_access(self, path: str) -> Optional[str]:
+        """
+        Subscript expression reading path straight from the source record.
+        
+        Only generated when the specimen reaches the end of the path
+        through dicts and in-range list indexes. Index steps go through
+        _list_item so that, like _get_value, only lists are indexed; a
+        record of another shape raises one of the exceptions the generated
+        fallback catches.
+        """
+        if self._specimen is None or not path or "[*]" in path:
+            return None
+        
+        code = "source"
+        current = self._specimen
+        for seg in path.split("."):
+            key, idx = seg, None
+            if "[" in seg:
+                key, idx = seg[:seg.index("[")], seg[seg.index("[")+1:]
+                if not idx.endswith("]") or not idx[:-1].lstrip("-").isdigit():
+                    return None
+                idx = int(idx[:-1])
+            if key:
+                if not isinstance(current, dict) or key not in current:
+                    return None
+                code += f"[{key!r}]"
+                current = current[key]
+            if idx is not None:
+                if not (isinstance(current, list) and -len(current) <= idx < len(current)):
+                    return None
+                code = f"_list_item({code}, {idx})"
+                current = current[idx]
+        return code
+    
     def _gen_transform(self, transform: Transform, is_array: bool = False) -> str:
         name = transform.name
         args = transform.args
@@ -291,7 +374,7 @@ if __name__ == "__main__":
                 for t in transforms:
                     single = self._gen_single_transform(t.name, t.args)
                     if is_array:
-                        result = f"self._apply_transform({result}, lambda x: {single.replace('_v', 'x')})"
+                        result = f"{self._call_prefix}_apply_transform({result}, lambda x: {single.replace('_v', 'x')})"
                     else:
                         result = f"(lambda _v: {single})({result})"
                 return result
@@ -299,7 +382,7 @@ if __name__ == "__main__":
         
         single = self._gen_single_transform(name, args)
         if is_array:
-            return f"self._apply_transform(_v, lambda x: {single.replace('_v', 'x')})"
+            return f"{self._call_prefix}_apply_transform(_v, lambda x: {single.replace('_v', 'x')})"
         return single
     
     def _gen_single_transform(self, name: str, args: list) -> str:
@@ -328,7 +411,7 @@ if __name__ == "__main__":
         elif name == "lookup":
             if args:
                 tbl = args[0][1:] if str(args[0]).startswith("@") else str(args[0])
-                return f'self._lookup("{tbl}", _v)'
+                return f'{self._call_prefix}_lookup("{tbl}", _v)'
             return "_v"
         elif name == "constant":
             return "_v"
@@ -27,6 +27,7 @@ from .flr_converter import (
     FLRPresets,
     RecordLayout,
     FieldDefinition,
+    compile_record_parser,
     flr_to_json
 )
 
@@ -47,5 +48,6 @@ __all__ = [
     'FLRPresets',
     'RecordLayout',
     'FieldDefinition',
+    'compile_record_parser',
     'flr_to_json',
 ]
@@ -10,9 +10,17 @@ Converts CSV records to JSON format for processing by the SchemaMap transformati
 
 import csv
 import io
-from typing import Dict, List, Any, Optional, Union, Iterator
+import itertools
+from typing import Dict, List, Any, Optional, Union, Iterator, Iterable, Tuple
 from pathlib import Path
 
+# Marks values missing from CSVConverter's boolean lookup table
+_NOT_BOOL = object()
+
+# Non-digit characters a number accepted by int()/float() may start with
+# (sign, decimal point, inf/nan); other text skips the parse attempts
+_NUMERIC_LEAD_CHARS = frozenset('+-.iInN')
+
 
 class CSVConverter:
     """
@@ -34,7 +42,8 @@ class CSVConverter:
         false_values: Optional[List[str]] = None,
         infer_types: bool = True,
         strip_whitespace: bool = True,
-        column_names: Optional[List[str]] = None
+        column_names: Optional[List[str]] = None,
+        needed_columns: Optional[Iterable[str]] = None
     ):
         """
         Initialize CSV converter.
@@ -51,6 +60,8 @@ class CSVConverter:
             infer_types: Whether to infer numeric/boolean types (default: True)
             strip_whitespace: Whether to strip whitespace from values (default: True)
             column_names: Override column names (used when has_header=False)
+            needed_columns: Only convert and return these columns; others are
+                skipped without type inference (default: all columns)
         """
         self.delimiter = delimiter
         self.quotechar = quotechar
@@ -60,10 +71,15 @@ class CSVConverter:
         self.infer_types = infer_types
         self.strip_whitespace = strip_whitespace
         self.column_names = column_names
+        self.needed_columns = set(needed_columns) if needed_columns is not None else None
         
         self.null_values = set(null_values or ['', 'null', 'NULL', 'None', 'NA', 'N/A', 'n/a'])
         self.true_values = set(true_values or ['true', 'True', 'TRUE', '1', 'yes', 'Yes', 'YES', 'Y', 'y'])
         self.false_values = set(false_values or ['false', 'False', 'FALSE', '0', 'no', 'No', 'NO', 'N', 'n'])
+        
+        # One lookup for both boolean spellings; true wins over false
+        self._bool_values: Dict[str, bool] = dict.fromkeys(self.false_values, False)
+        self._bool_values.update(dict.fromkeys(self.true_values, True))
     
     def _convert_value(self, value: str) -> Any:
         """Convert a string value to appropriate type."""
@@ -78,14 +94,18 @@ class CSVConverter:
             return value
         
         # Check for boolean
-        if value in self.true_values:
-            return True
-        if value in self.false_values:
-            return False
+        boolean = self._bool_values.get(value, _NOT_BOOL)
+        if boolean is not _NOT_BOOL:
+            return boolean
+        
+        # Text that cannot start a number would only raise below
+        lead = value[:1]
+        if not (lead.isdecimal() or lead in _NUMERIC_LEAD_CHARS or lead.isspace()):
+            return value
         
         # Try integer
         try:
-            if '.' not in value and 'e' not in value.lower():
+            if '.' not in value and 'e' not in value and 'E' not in value:
                 return int(value)
         except ValueError:
             pass
@@ -108,6 +128,16 @@ class CSVConverter:
                 result[header] = None
         return result
     
+    def _columns_to_dict(self, row: List[str], columns: List[Tuple[int, str]]) -> Dict[str, Any]:
+        """Convert only the selected (index, header) columns of a CSV row."""
+        result = {}
+        for i, header in columns:
+            if i < len(row):
+                result[header] = self._convert_value(row[i])
+            else:
+                result[header] = None
+        return result
+    
     def convert_file(self, file_path: Union[str, Path]) -> List[Dict[str, Any]]:
         """
         Convert a CSV file to a list of JSON objects.
@@ -188,13 +218,18 @@ class CSVConverter:
             try:
                 first_row = next(reader)
                 headers = [f"col_{i}" for i in range(len(first_row))]
-                yield self._row_to_dict(first_row, headers)
             except StopIteration:
                 return
+            reader = itertools.chain([first_row], reader)
         
         # Process rows
-        for row in reader:
-            yield self._row_to_dict(row, headers)
+        if self.needed_columns is not None:
+            columns = [(i, h) for i, h in enumerate(headers) if h in self.needed_columns]
+            for row in reader:
+                yield self._columns_to_dict(row, columns)
+        else:
+            for row in reader:
+                yield self._row_to_dict(row, headers)
     
     def convert_row(self, row: List[str], headers: List[str]) -> Dict[str, Any]:
         """
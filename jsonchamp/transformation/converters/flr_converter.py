@@ -13,7 +13,10 @@ each field occupies a specific number of characters at fixed positions.
 """
 
 import json
-from typing import Dict, List, Any, Optional, Union, Iterator, Tuple
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Any, Optional, Union, Iterable, Iterator, Tuple, Callable
 from pathlib import Path
 from dataclasses import dataclass
 
@@ -46,6 +49,88 @@ class FieldDefinition:
         return self.start - 1 + self.length
 
 
+_TRUE_VALUES = frozenset(('Y', 'YES', 'T', 'TRUE', '1'))
+
+# Slices that reorder an 8-character date into YYYY-MM-DD
+_DATE_SLICES = {
+    'YYYYMMDD': ('v[:4]', 'v[4:6]', 'v[6:8]'),
+    'MMDDYYYY': ('v[4:8]', 'v[:2]', 'v[2:4]'),
+    'DDMMYYYY': ('v[4:8]', 'v[2:4]', 'v[:2]'),
+}
+
+
+def _field_statements(field: 'FieldDefinition', target: str) -> List[str]:
+    """Source lines assigning the converted value of field, given its text in `v`."""
+    present = 'v' if field.null_value is None else f'v and v != {field.null_value!r}'
+    
+    if field.data_type in ('integer', 'decimal'):
+        if field.data_type == 'integer':
+            expr = 'int(v)'
+        elif field.decimal_places > 0:
+            # Implied decimal point (common in COBOL)
+            places = field.decimal_places
+            expr = (f"float(v) if '.' in v else "
+                    f"float((v[:-{places}] or '0') + '.' + v[-{places}:].ljust({places}, '0'))")
+        else:
+            expr = 'float(v)'
+        # Conversion errors are caught inline rather than through a helper call
+        return [
+            f'if {present}:',
+            f'    try:',
+            f'        {target} = {expr}',
+            f'    except ValueError:',
+            f'        {target} = None',
+            f'else:',
+            f'    {target} = None',
+        ]
+    
+    if field.data_type == 'boolean':
+        expr = 'v.upper() in _TRUE_VALUES'
+    elif field.data_type == 'date' and field.date_format in _DATE_SLICES:
+        year, month, day = _DATE_SLICES[field.date_format]
+        expr = f"({year} + '-' + {month} + '-' + {day} if len(v) == 8 else v)"
+    else:
+        expr = 'v'
+    return [f'{target} = {expr} if {present} else None']
+
+
+@lru_cache(maxsize=64)
+def _compile_parser(signature: Tuple[tuple, ...], strip_record: bool) -> Callable[[str], Dict[str, Any]]:
+    fields = [FieldDefinition(*spec) for spec in signature]
+    lines = ['def parse_record(record):']
+    if strip_record:
+        lines.append('    record = record.rstrip()')
+    for i, field in enumerate(fields):
+        strip = '.strip()' if field.trim else ''
+        lines.append(f'    v = record[{field.slice_start}:{field.slice_end}]{strip}')
+        lines.extend('    ' + line for line in _field_statements(field, f'f{i}'))
+    items = ', '.join(f'{field.name!r}: f{i}' for i, field in enumerate(fields))
+    lines.append(f'    return {{{items}}}')
+    
+    namespace = {'_TRUE_VALUES': _TRUE_VALUES}
+    exec(compile('\n'.join(lines), '<flr record parser>', 'exec'), namespace)
+    return namespace['parse_record']
+
+
+def compile_record_parser(layout: 'RecordLayout', strip_record: bool = False) -> Callable[[str], Dict[str, Any]]:
+    """
+    Generate a record parsing function specialized for a layout.
+    
+    The generated function slices every field at literal offsets and
+    converts it inline, producing the same dictionary as walking the
+    layout's field definitions one by one. Parsers are cached by layout
+    signature, so identical layouts share one compiled function.
+    
+    Args:
+        layout: Record layout definition
+        strip_record: Strip trailing whitespace from each record first
+        
+    Returns:
+        Function taking a record string and returning a dictionary
+    """
+    return _compile_parser(layout.signature(), strip_record)
+
+
 class RecordLayout:
     """
     Defines the layout of a fixed-length record.
@@ -96,6 +181,14 @@ class RecordLayout:
         self.fields.append(FieldDefinition(name=name, start=start, length=length, **kwargs))
         return self
     
+    def signature(self) -> Tuple[tuple, ...]:
+        """Hashable summary of every field definition, in layout order."""
+        return tuple(
+            (f.name, f.start, f.length, f.data_type, f.decimal_places,
+             f.date_format, f.trim, f.null_value)
+            for f in self.fields
+        )
+    
     def get_field(self, name: str) -> Optional[FieldDefinition]:
         """Get field definition by name."""
         for field in self.fields:
@@ -283,7 +376,8 @@ class FLRConverter:
         strip_record: bool = False,
         line_ending: str = None,  # Auto-detect if None
         header_lines: int = 0,
-        footer_lines: int = 0
+        footer_lines: int = 0,
+        record_parser: Callable[[str], Dict[str, Any]] = None
     ):
         """
         Initialize FLR converter.
@@ -296,6 +390,8 @@ class FLRConverter:
             line_ending: Line ending character(s) (auto-detect if None)
             header_lines: Number of header lines to skip
             footer_lines: Number of footer lines to skip
+            record_parser: Function parsing one record string into a dictionary
+                (default: compiled from the layout, see compile_record_parser)
         """
         self.layout = layout
         self.encoding = encoding
@@ -304,68 +400,13 @@ class FLRConverter:
         self.line_ending = line_ending
         self.header_lines = header_lines
         self.footer_lines = footer_lines
+        self.record_parser = record_parser
     
-    def _convert_value(self, raw_value: str, field: FieldDefinition) -> Any:
-        """Convert a raw string value according to field definition."""
-        if field.trim:
-            value = raw_value.strip()
-        else:
-            value = raw_value
-        
-        # Check for null
-        if field.null_value is not None and value == field.null_value:
-            return None
-        if not value:
-            return None
-        
-        # Type conversion
-        if field.data_type == 'integer':
-            try:
-                return int(value)
-            except ValueError:
-                return None
-        
-        elif field.data_type == 'decimal':
-            try:
-                # Handle implied decimal (common in COBOL)
-                if field.decimal_places > 0 and '.' not in value:
-                    # Insert decimal point
-                    int_part = value[:-field.decimal_places] or '0'
-                    dec_part = value[-field.decimal_places:].ljust(field.decimal_places, '0')
-                    value = f"{int_part}.{dec_part}"
-                return float(value)
-            except ValueError:
-                return None
-        
-        elif field.data_type == 'boolean':
-            return value.upper() in ('Y', 'YES', 'T', 'TRUE', '1')
-        
-        elif field.data_type == 'date':
-            # Return as string (can be transformed by SchemaMap)
-            # But clean up common formats
-            if field.date_format == 'YYYYMMDD' and len(value) == 8:
-                return f"{value[:4]}-{value[4:6]}-{value[6:8]}"
-            elif field.date_format == 'MMDDYYYY' and len(value) == 8:
-                return f"{value[4:8]}-{value[:2]}-{value[2:4]}"
-            elif field.date_format == 'DDMMYYYY' and len(value) == 8:
-                return f"{value[4:8]}-{value[2:4]}-{value[:2]}"
-            return value
-        
-        else:  # string
-            return value
-    
-    def _parse_record(self, record: str) -> Dict[str, Any]:
-        """Parse a single fixed-length record into a dictionary."""
-        if self.strip_record:
-            record = record.rstrip()
-        
-        result = {}
-        for field in self.layout.fields:
-            # Extract field value
-            raw_value = record[field.slice_start:field.slice_end]
-            result[field.name] = self._convert_value(raw_value, field)
-        
-        return result
+    def _get_record_parser(self) -> Callable[[str], Dict[str, Any]]:
+        """Return the record parser, compiling one for the current layout if needed."""
+        if self.record_parser is not None:
+            return self.record_parser
+        return compile_record_parser(self.layout, self.strip_record)
     
     def convert_string(self, content: str) -> List[Dict[str, Any]]:
         """
@@ -417,25 +458,24 @@ class FLRConverter:
             Dictionary for each record
         """
         with open(file_path, 'r', encoding=self.encoding) as f:
-            lines = f.readlines()
-        
-        # Remove line endings
-        lines = [line.rstrip('\r\n') for line in lines]
-        
-        yield from self._iterate_lines(lines)
+            # Lines are read one at a time; remove line endings
+            yield from self._iterate_lines(line.rstrip('\r\n') for line in f)
     
-    def _iterate_lines(self, lines: List[str]) -> Iterator[Dict[str, Any]]:
+    def _iterate_lines(self, lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
         """Internal method to iterate over lines."""
         # Skip header lines
-        start_idx = self.header_lines
+        lines = islice(lines, self.header_lines, None)
         
         # Skip footer lines
-        end_idx = len(lines) - self.footer_lines if self.footer_lines > 0 else len(lines)
+        if self.footer_lines > 0:
+            lines = _without_last(lines, self.footer_lines)
         
-        for line in lines[start_idx:end_idx]:
-            if self.skip_blank_lines and not line.strip():
+        parse_record = self._get_record_parser()
+        skip_blank_lines = self.skip_blank_lines
+        for line in lines:
+            if skip_blank_lines and not line.strip():
                 continue
-            yield self._parse_record(line)
+            yield parse_record(line)
     
     def convert_record(self, record: str) -> Dict[str, Any]:
         """
@@ -447,7 +487,16 @@ class FLRConverter:
         Returns:
             Dictionary
         """
-        return self._parse_record(record)
+        return self._get_record_parser()(record)
+
+
+def _without_last(lines: Iterable[str], count: int) -> Iterator[str]:
+    """Yield all but the last count lines, holding back only that many."""
+    held = deque()
+    for line in lines:
+        held.append(line)
+        if len(held) > count:
+            yield held.popleft()
 
 
 def flr_to_json(
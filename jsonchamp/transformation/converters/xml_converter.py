@@ -9,7 +9,7 @@ Converts XML documents to JSON format for processing by the SchemaMap transforma
 """
 
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Iterable, Iterator
 from pathlib import Path
 from collections import defaultdict
 
@@ -31,7 +31,7 @@ class XMLConverter:
         attr_prefix: str = '@',
         text_key: str = '#text',
         cdata_key: str = '#cdata',
-        always_array: Optional[List[str]] = None,
+        always_array: Optional[Iterable[str]] = None,
         strip_whitespace: bool = True,
         strip_namespaces: bool = False,
         force_list: bool = False,
@@ -59,7 +59,7 @@ class XMLConverter:
         self.attr_prefix = attr_prefix
         self.text_key = text_key
         self.cdata_key = cdata_key
-        self.always_array = set(always_array or [])
+        self.always_array = frozenset(always_array or ())
         self.strip_whitespace = strip_whitespace
         self.strip_namespaces = strip_namespaces
         self.force_list = force_list
@@ -129,7 +129,7 @@ class XMLConverter:
             
             # Add children to result
             for child_tag, child_list in child_groups.items():
-                if len(child_list) == 1 and child_tag not in self.always_array and not self.force_list:
+                if len(child_list) == 1 and not self.force_list and child_tag not in self.always_array:
                     result[child_tag] = child_list[0]
                 else:
                     result[child_tag] = child_list
@@ -201,14 +201,32 @@ class XMLConverter:
             List of dictionaries (one per matching element)
         """
         root = ET.fromstring(xml_content)
-        
+        return [self._element_to_dict(elem) for elem in self._find_elements(root, element_path)]
+    
+    @staticmethod
+    def _find_elements(root: ET.Element, element_path: str) -> List[ET.Element]:
+        """Find record elements below root, anywhere or by direct path."""
         # Simple path parsing (support basic XPath-like syntax)
-        elements = root.findall('.//' + element_path.replace('/', '/'))
+        elements = root.findall('.//' + element_path)
         if not elements:
             # Try direct path
             elements = root.findall(element_path)
+        return elements
+    
+    @staticmethod
+    def _simple_path_steps(element_path: str) -> Optional[List[str]]:
+        """
+        Split a path of plain tag names (or '*') into its steps.
         
-        return [self._element_to_dict(elem) for elem in elements]
+        Returns None for paths using other XPath syntax (predicates,
+        attributes, '.', '..', '//', namespace prefixes), which can only
+        be resolved against a fully parsed document.
+        """
+        steps = element_path.split('/')
+        for step in steps:
+            if not step or step in ('.', '..') or any(c in step for c in '[]()@=:{}') or step.split() != [step]:
+                return None
+        return steps
     
     def convert_file_elements(self, file_path: Union[str, Path], element_path: str) -> List[Dict[str, Any]]:
         """
@@ -221,14 +239,65 @@ class XMLConverter:
         Returns:
             List of dictionaries
         """
-        tree = ET.parse(file_path)
-        root = tree.getroot()
+        return list(self.iter_file_elements(file_path, element_path))
+    
+    def iter_file_elements(self, file_path: Union[str, Path], element_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over matching elements of an XML file, yielding dictionaries.
         
-        elements = root.findall('.//' + element_path.replace('/', '/'))
-        if not elements:
-            elements = root.findall(element_path)
+        Memory-efficient for large files: the document is parsed
+        incrementally and each record element is discarded once converted,
+        so only one record is held at a time. Paths using more than plain
+        tag names fall back to parsing the whole document.
         
-        return [self._element_to_dict(elem) for elem in elements]
+        Args:
+            file_path: Path to XML file
+            element_path: XPath-like path to elements
+            
+        Yields:
+            Dictionary for each matching element, in document order
+        """
+        steps = self._simple_path_steps(element_path)
+        if steps is None:
+            root = ET.parse(file_path).getroot()
+            for elem in self._find_elements(root, element_path):
+                yield self._element_to_dict(elem)
+            return
+        
+        depth = len(steps)
+        parents = []    # The open elements, root first
+        is_record = []  # Whether each open element is a record
+        matched = []    # Records inside the outermost open record
+        open_records = 0
+        
+        for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+            if event == 'start':
+                parents.append(elem)
+                # Same rule as root.findall('.//' + element_path)
+                record = len(parents) > depth and all(
+                    step == '*' or step == open_elem.tag
+                    for step, open_elem in zip(steps, parents[-depth:])
+                )
+                is_record.append(record)
+                if record:
+                    matched.append(elem)
+                    open_records += 1
+                continue
+            
+            parents.pop()
+            if is_record.pop():
+                open_records -= 1
+            if open_records:
+                continue
+            
+            # Nested records are emitted in document order once the outermost ends
+            for record in matched:
+                yield self._element_to_dict(record)
+            matched.clear()
+            
+            # Drop finished subtrees so the parsed tree never grows
+            if parents:
+                del parents[-1][:]
 
 
 def xml_to_json(
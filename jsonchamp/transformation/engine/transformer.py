@@ -13,7 +13,7 @@ from __future__ import annotations
 import json
 import uuid
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 from pathlib import Path
 
 from ..parser.parser import (
@@ -97,11 +97,11 @@ class SchemaMapTransformer:
             SchemaMapTransformer instance
         """
         path = Path(filepath)
-        if not path.exists():
-            raise FileNotFoundError(f"Mapping file not found: {filepath}")
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Mapping file not found: {filepath}") from None
         
         parser = SchemaMapParser()
         mapping_file = parser.parse(content, filename=str(path))
@@ -454,4 +454,39 @@ class SchemaMapTransformer:
         Returns:
             List of transformed JSON objects
         """
-        return [self.transform(item) for item in items]
+        return list(self.transform_many(items))
+    
+    def transform_many(self, items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Transform items one by one, yielding each result as it is produced.
+        
+        Gives the same results as calling transform() on every item, but
+        resolves the handler for each top-level mapping item and the
+        post-processing settings once for the whole run.
+        
+        Args:
+            items: Iterable of source JSON objects
+            
+        Yields:
+            Transformed JSON object for each item
+        """
+        steps = []
+        for mapping_item in self.mapping_file.mappings:
+            if isinstance(mapping_item, Mapping):
+                steps.append((self._apply_mapping, mapping_item))
+            elif isinstance(mapping_item, ConditionalBlock):
+                steps.append((self._apply_conditional, mapping_item))
+            elif isinstance(mapping_item, NestedBlock):
+                steps.append((self._apply_nested_block, mapping_item))
+        
+        evaluator = self.evaluator
+        remove_nulls = self._remove_nulls if self.config.get("null_handling") == "omit" else None
+        
+        for source_data in items:
+            evaluator.context = source_data
+            target_data = {}
+            for apply, mapping_item in steps:
+                apply(mapping_item, source_data, target_data)
+            if remove_nulls is not None:
+                target_data = remove_nulls(target_data)
+            yield target_data
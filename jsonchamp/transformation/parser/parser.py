@@ -10,7 +10,8 @@ Supports @functions for external Python function registration and @call for invo
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Union
+import re
+from typing import Any, Dict, List, Optional, Set, Union
 from dataclasses import dataclass, field
 from .lexer import SchemaMapLexer, Token, TokenType, LexerError
 
@@ -160,6 +161,62 @@ class MappingFile:
     mappings: List[Union[Mapping, ConditionalBlock, NestedBlock]] = field(default_factory=list)
     source_file: Optional[str] = None
 
+    def referenced_source_keys(self) -> Optional[Set[str]]:
+        """
+        Top-level source keys that the mappings can read.
+        
+        Returns None when this cannot be determined statically, e.g. for
+        @compute/@call expressions or paths into the source root itself.
+        """
+        keys: Set[str] = set()
+        
+        def add_path(path: Optional[SourcePath]) -> bool:
+            if path is None:
+                return True
+            return add_path_string(str(path))
+        
+        def add_path_string(path: str) -> bool:
+            # Same first segment the evaluator resolves
+            if path.startswith("."):
+                path = path[1:]
+            key = re.split(r"[.\[]", path, maxsplit=1)[0]
+            if not key:
+                return False
+            keys.add(key)
+            return True
+        
+        def add_items(items) -> bool:
+            for item in items:
+                if isinstance(item, Mapping):
+                    if isinstance(item.target, SkipTarget):
+                        continue
+                    source = item.source
+                    if isinstance(source, SourcePath):
+                        if not add_path(source):
+                            return False
+                    elif isinstance(source, MergeExpression):
+                        for part in source.parts:
+                            if isinstance(part, SourcePath) and not add_path(part):
+                                return False
+                    elif isinstance(source, ComputeExpression):
+                        if source.type not in ("now", "uuid"):
+                            return False
+                    elif not isinstance(source, ConstantValue):
+                        return False
+                elif isinstance(item, ConditionalBlock):
+                    if item.condition is not None and not add_path_string(item.condition.field):
+                        return False
+                    if not add_items(item.mappings):
+                        return False
+                elif isinstance(item, NestedBlock):
+                    if not add_path(item.base_path) or not add_items(item.mappings):
+                        return False
+                else:
+                    return False
+            return True
+        
+        return keys if add_items(self.mappings) else None
+
 
 class SchemaMapParser:
     """Parser for the SchemaMap DSL."""
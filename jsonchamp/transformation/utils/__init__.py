@@ -1,4 +1,4 @@
 """SchemaMap Utilities."""
-from .validation import validate_json_schema, ValidationError
+from .validation import validate_json_schema, load_schema_validator, ValidationError
 
-__all__ = ["validate_json_schema", "ValidationError"]
+__all__ = ["validate_json_schema", "load_schema_validator", "ValidationError"]
@@ -0,0 +1,338 @@
+"""
+SchemaMap Runner Helpers
+
+Copyright (C) 2025-2030, All Rights Reserved
+Ashutosh Sinha
+Email: ajsinha@gmail.com
+
+Helpers shared by the transform_*.py command-line runners.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+from collections import deque
+from contextlib import contextmanager
+from itertools import chain, islice
+from pathlib import Path
+
+from .. import load_mapping
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Parsed mappings are reused across runs unless --no-mapping-cache is given
+MAPPING_CACHE_DIR = Path.home() / ".cache" / "jsonchamp" / "mappings"
+
+# Write buffer for --output files
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Records sent to a worker process at a time by parallel_transform
+TRANSFORM_CHUNK_SIZE = 500
+
+# Per-process transformer built by _init_worker
+_WORKER_TRANSFORMER = None
+
+# Per-run values ignored when benchmarks compare transformer outputs
+DYNAMIC_FIELDS = frozenset(('transformedAt', 'transformationId', 'transformId', 'processedAt', 'recordId'))
+
+# Digit runs long enough to be an integer orjson cannot hold exactly
+_WIDE_INT_BYTES = re.compile(rb"\d{19,}")
+_WIDE_INT_TEXT = re.compile(r"\d{19,}")
+
+
+def _has_non_finite(data) -> bool:
+    """Check whether data holds a NaN or infinite float at any depth."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, float):
+            if not math.isfinite(node):
+                return True
+        elif isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return False
+
+
+def _orjson_dumps(data, indent=None):
+    """
+    Encode data as UTF-8 JSON bytes with orjson.
+    
+    Returns None when orjson is not installed, for indents other than
+    None/2, or for values orjson cannot encode. orjson writes NaN and
+    Infinity as null, so output that may hold one of them is also left
+    to json, which writes them as NaN/Infinity.
+    """
+    if not HAS_ORJSON or indent not in (None, 2):
+        return None
+    # Datetimes go through default=str, matching the json.dumps output
+    option = orjson.OPT_PASSTHROUGH_DATETIME
+    if indent == 2:
+        option |= orjson.OPT_INDENT_2
+    try:
+        encoded = orjson.dumps(data, default=str, option=option)
+    except (orjson.JSONEncodeError, TypeError):
+        return None
+    # Without a null in the output there was nothing non-finite to replace
+    if b"null" in encoded and _has_non_finite(data):
+        return None
+    return encoded
+
+
+def _compact_separators():
+    """Separators for compact json output, matching orjson's when it is installed."""
+    return (",", ":") if HAS_ORJSON else None
+
+
+def parse_json(content):
+    """
+    Parse JSON text or UTF-8 bytes, using orjson when it is exact.
+    
+    orjson turns integers wider than 64 bits into floats, so input with a
+    run of 19 or more digits goes to the standard library, as does input
+    orjson rejects (such as NaN); json then also supplies the error message.
+    """
+    if HAS_ORJSON:
+        pattern = _WIDE_INT_TEXT if isinstance(content, str) else _WIDE_INT_BYTES
+        if pattern.search(content) is None:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(content)
+
+
+def write_json(out, data, indent=None) -> None:
+    """
+    Write data to the binary stream out as UTF-8 JSON.
+    
+    Compact and indent=2 output is encoded in one pass by orjson when it is
+    installed. Otherwise indented output is written chunk by chunk as the
+    encoder produces it instead of being joined into one string first.
+    """
+    encoded = _orjson_dumps(data, indent)
+    if encoded is not None:
+        out.write(encoded)
+    elif indent is None:
+        # Only one-shot compact encoding runs in C; iterencode would not
+        out.write(json.dumps(data, default=str, separators=_compact_separators()).encode('utf-8'))
+    else:
+        for chunk in json.JSONEncoder(indent=indent, default=str).iterencode(data):
+            out.write(chunk.encode('utf-8'))
+
+
+def write_json_array(out, items, indent=None, level=0) -> int:
+    """
+    Stream items to the binary stream out as a JSON array, one at a time.
+    
+    The layout matches json.dumps(list(items), indent=indent) nested at the
+    given indentation level, without holding the whole list in memory;
+    items are encoded with orjson when available, so compact output then
+    has no spaces after separators. Returns the number of items written.
+    """
+    if indent is None:
+        opening, separator, closing = b"[", b"," if HAS_ORJSON else b", ", b"]"
+        pad = None
+    else:
+        pad = b"\n" + b" " * (indent * (level + 1))
+        opening, separator = b"[" + pad, b"," + pad
+        closing = b"\n" + b" " * (indent * level) + b"]"
+    
+    separators = _compact_separators() if indent is None else None
+    write = out.write
+    count = 0
+    for item in items:
+        encoded = _orjson_dumps(item, indent)
+        if encoded is None:
+            encoded = json.dumps(item, indent=indent, default=str, separators=separators).encode('utf-8')
+        if pad is not None:
+            encoded = encoded.replace(b"\n", pad)
+        write(separator if count else opening)
+        write(encoded)
+        count += 1
+    
+    out.write(closing if count else b"[]")
+    return count
+
+
+def open_output(path=None):
+    """
+    Open the binary stream JSON output is written to.
+    
+    Files get a large write buffer; without a path this is stdout's
+    underlying buffer, flushed first so earlier text output stays in order.
+    """
+    if path is None:
+        sys.stdout.flush()
+        return sys.stdout.buffer
+    return open(path, 'wb', buffering=OUTPUT_BUFFER_SIZE)
+
+
+@contextmanager
+def output_stream(path=None):
+    """
+    Open the JSON output stream for a with block, as open_output() does.
+    
+    Output to stdout is ended with a newline. A file is closed on exit,
+    and removed again when writing it fails, so a record that fails
+    mid-stream never leaves a truncated array behind.
+    """
+    out = open_output(path)
+    try:
+        yield out
+        if path is None:
+            out.write(b"\n")
+    except BaseException:
+        if path is not None:
+            out.close()
+            Path(path).unlink(missing_ok=True)
+        raise
+    if path is not None:
+        out.close()
+
+
+def _validated(items, validate):
+    """Yield items after passing each one to validate."""
+    for item in items:
+        validate(item)
+        yield item
+
+
+def write_records(out, items, indent=None, wrap_array=False, validate=None) -> int:
+    """
+    Stream transformed records to the binary stream out as a JSON array.
+    
+    With wrap_array the array is written as {"records": [...], "count": N}.
+    When validate is given it is called on each record before the record
+    is written. Returns the number of records written.
+    """
+    if validate is not None:
+        items = _validated(items, validate)
+    if not wrap_array:
+        return write_json_array(out, items, indent)
+    
+    out.write(b'{"records": ' if indent is None else b'{\n  "records": ')
+    count = write_json_array(out, items, indent, level=1)
+    tail = f', "count": {count}}}' if indent is None else f',\n  "count": {count}\n}}'
+    out.write(tail.encode('utf-8'))
+    return count
+
+
+def load_transformer(mapping_path, functions_path=None, cache_dir=None):
+    """Load a mapping and register the functions in functions_path, if given."""
+    transformer = load_mapping(mapping_path, cache_dir)
+    if functions_path:
+        transformer.register_file(functions_path)
+    return transformer
+
+
+def _init_worker(factory, factory_args):
+    """Build the transformer once in each worker process."""
+    global _WORKER_TRANSFORMER
+    _WORKER_TRANSFORMER = factory(*factory_args)
+
+
+def _transform_chunk(records):
+    """Transform a chunk of records with this worker's transformer."""
+    return _WORKER_TRANSFORMER.transform_batch(records)
+
+
+def parallel_transform(records, transformer, factory_args=(), workers=None,
+                       factory=load_transformer):
+    """
+    Transform records in worker processes, yielding results in input order.
+    
+    Each worker builds its own transformer as factory(*factory_args).
+    Inputs of one chunk or less are transformed by transformer in this
+    process instead, as starting a pool would cost more than it saves.
+    Records are sent in chunks of TRANSFORM_CHUNK_SIZE with at most two
+    chunks per worker in flight, so a streamed input is never read ahead
+    of the output by more than that.
+    """
+    records = iter(records)
+    head = list(islice(records, TRANSFORM_CHUNK_SIZE + 1))
+    if len(head) <= TRANSFORM_CHUNK_SIZE:
+        yield from transformer.transform_batch(head)
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    workers = workers or os.cpu_count() or 1
+    records = chain(head, records)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(factory, factory_args)) as executor:
+        pending = deque()
+        for chunk in iter(lambda: list(islice(records, TRANSFORM_CHUNK_SIZE)), []):
+            pending.append(executor.submit(_transform_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def transform_records(records, transformer, factory_args=(), workers=1):
+    """
+    Lazily transform records, in worker processes unless workers is 1.
+    
+    workers=0 uses one process per CPU; factory_args are passed on to
+    parallel_transform() to build each worker's transformer.
+    """
+    if workers != 1:
+        return parallel_transform(records, transformer, factory_args, workers)
+    return transformer.transform_many(records)
+
+
+def stable_hash(data) -> bytes:
+    """
+    Digest of a result tree, skipping DYNAMIC_FIELDS at any depth.
+    
+    The tree is walked iteratively and fed to BLAKE2b without building a
+    filtered copy. Dict key order is ignored and numbers hash by value
+    (1 and 1.0 agree), so equal digests mean the trees compare equal
+    apart from the dynamic fields.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    update = digest.update
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            items = sorted(((repr(k), v) for k, v in node.items() if k not in DYNAMIC_FIELDS),
+                           key=lambda item: item[0])
+            # Keys first, then values in the same order; every entry is
+            # length-prefixed so the stream stays unambiguous
+            update(b"{%d;" % len(items))
+            for key, _ in items:
+                encoded = key.encode('utf-8', 'surrogatepass')
+                update(b"%d:" % len(encoded))
+                update(encoded)
+            stack.extend(value for _, value in reversed(items))
+        elif isinstance(node, (list, tuple)):
+            update(b"%s%d;" % (b"[" if isinstance(node, list) else b"(", len(node)))
+            stack.extend(reversed(node))
+        elif isinstance(node, str):
+            encoded = node.encode('utf-8', 'surrogatepass')
+            update(b"s%d:" % len(encoded))
+            update(encoded)
+        elif node is None:
+            update(b"n")
+        elif isinstance(node, bool):
+            update(b"T" if node else b"F")
+        elif isinstance(node, int):
+            update(b"i%d;" % node)
+        elif isinstance(node, float) and node.is_integer():
+            update(b"i%d;" % int(node))
+        else:
+            encoded = f"{type(node).__qualname__}:{node!r}".encode('utf-8', 'surrogatepass')
+            update(b"o%d:" % len(encoded))
+            update(encoded)
+    return digest.digest()
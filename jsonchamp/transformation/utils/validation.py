@@ -10,8 +10,7 @@ JSON Schema validation for transformed output.
 
 from __future__ import annotations
 import json
-from typing import Any, Dict, List, Optional
-from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 
 class ValidationError(Exception):
@@ -37,22 +36,44 @@ def validate_json_schema(data: Dict[str, Any], schema_path: str) -> bool:
         ValidationError: If validation fails
         FileNotFoundError: If schema file not found
     """
-    path = Path(schema_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Schema file not found: {schema_path}")
+    return load_schema_validator(schema_path)(data)
+
+
+def load_schema_validator(schema_path: str) -> Callable[[Any], bool]:
+    """
+    Load a JSON Schema once and return a function that validates data against it.
     
-    with open(path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
+    Use this instead of validate_json_schema() when checking many records
+    against the same schema, so the file is read and parsed only once.
     
-    errors = _validate_against_schema(data, schema)
+    Args:
+        schema_path: Path to the JSON Schema file
+        
+    Returns:
+        Function taking the data to validate; it returns True or raises
+        ValidationError like validate_json_schema()
+        
+    Raises:
+        FileNotFoundError: If schema file not found
+    """
+    try:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema file not found: {schema_path}") from None
     
-    if errors:
-        raise ValidationError(
-            f"Validation failed with {len(errors)} error(s)",
-            errors=errors
-        )
+    def validate(data: Any) -> bool:
+        errors = _validate_against_schema(data, schema)
+        
+        if errors:
+            raise ValidationError(
+                f"Validation failed with {len(errors)} error(s)",
+                errors=errors
+            )
+        
+        return True
     
-    return True
+    return validate
 
 
 def _validate_against_schema(data: Any, schema: Dict, path: str = "") -> List[str]:
@@ -17,15 +17,27 @@ This script demonstrates all the key features of JsonSchemaCodeGen with
 extensive examples covering various use cases.
 """
 
+import functools
+import heapq
+import io
 import json
 import os
 import sys
 import shutil
 from pathlib import Path
 from datetime import datetime, date
+from typing import Optional, Tuple
+
+_HERE = Path(__file__).resolve().parent
+_EXAMPLES_DIR = _HERE / "examples" / "schemas"
+_DEMO_OUTPUT = _HERE / "demo_output"
+
+# Shared encoders for display output (built once instead of per json.dumps call)
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, default=str)
+_COMPACT = json.JSONEncoder(default=str).encode
 
 # Add package to path for direct execution
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(_HERE))
 
 from jsonchamp import (
     SchemaProcessor,
@@ -76,20 +88,58 @@ def print_code(code: str, max_lines: int = 50) -> None:
 
 
 def print_json(data: any, max_lines: int = 30) -> None:
-    """Print JSON with line limit."""
-    output = json.dumps(data, indent=2, default=str)
-    lines = output.split('\n')
-    if len(lines) > max_lines:
-        print('\n'.join(lines[:max_lines]))
-        print(f"\n... ({len(lines) - max_lines} more lines)")
-    else:
-        print(output)
+    """Print JSON with line limit, stopping the encoder once the limit is hit."""
+    chunks = []
+    newlines = 0
+    for chunk in _PRETTY_ENCODER.iterencode(data):
+        chunks.append(chunk)
+        newlines += chunk.count('\n')
+        if newlines >= max_lines:
+            lines = ''.join(chunks).split('\n', max_lines)
+            print('\n'.join(lines[:max_lines]))
+            print(f"\n... (truncated at {max_lines} lines)")
+            return
+    print(''.join(chunks))
+
+
+class DemoBuffer:
+    """Collect everything printed inside the block and emit it in one write."""
+    
+    def __enter__(self) -> "DemoBuffer":
+        self._stdout = sys.stdout
+        self._buffer = io.StringIO()
+        sys.stdout = self._buffer
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        sys.stdout = self._stdout
+        data = self._buffer.getvalue().encode("utf-8")
+        try:
+            fd = self._stdout.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            self._stdout.write(data.decode("utf-8"))
+            return
+        self._stdout.flush()
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+
+def buffered_demo(func):
+    """Decorator that runs a demo inside a DemoBuffer."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with DemoBuffer():
+            return func(*args, **kwargs)
+    return wrapper
 
 
 # =============================================================================
 # EXAMPLE 1: BASIC SCHEMA PROCESSING
 # =============================================================================
 
+@buffered_demo
 def demo_basic_schema():
     """Demonstrate basic schema processing with a simple object."""
     print_header("EXAMPLE 1: BASIC SCHEMA PROCESSING")
@@ -137,6 +187,7 @@ def demo_basic_schema():
 # EXAMPLE 2: NESTED OBJECTS
 # =============================================================================
 
+@buffered_demo
 def demo_nested_objects():
     """Demonstrate handling of nested object schemas."""
     print_header("EXAMPLE 2: NESTED OBJECTS")
@@ -201,6 +252,7 @@ def demo_nested_objects():
 # EXAMPLE 3: ARRAYS AND COLLECTIONS
 # =============================================================================
 
+@buffered_demo
 def demo_arrays():
     """Demonstrate various array types and configurations."""
     print_header("EXAMPLE 3: ARRAYS AND COLLECTIONS")
@@ -274,6 +326,7 @@ def demo_arrays():
 # EXAMPLE 4: STRING FORMATS AND PATTERNS
 # =============================================================================
 
+@buffered_demo
 def demo_string_formats():
     """Demonstrate various string formats and patterns."""
     print_header("EXAMPLE 4: STRING FORMATS AND PATTERNS")
@@ -331,6 +384,7 @@ def demo_string_formats():
 # EXAMPLE 5: ENUMS AND CONSTANTS
 # =============================================================================
 
+@buffered_demo
 def demo_enums():
     """Demonstrate enums and constant values."""
     print_header("EXAMPLE 5: ENUMS AND CONSTANTS")
@@ -382,13 +436,14 @@ def demo_enums():
     print_subheader("Sample Data")
     samples = processor.generate_samples(count=3)
     for i, sample in enumerate(samples, 1):
-        print(f"Sample {i}: {json.dumps(sample, default=str)}")
+        print(f"Sample {i}: {_COMPACT(sample)}")
 
 
 # =============================================================================
 # EXAMPLE 6: NUMERIC CONSTRAINTS
 # =============================================================================
 
+@buffered_demo
 def demo_numeric_constraints():
     """Demonstrate numeric types with constraints."""
     print_header("EXAMPLE 6: NUMERIC CONSTRAINTS")
@@ -461,6 +516,7 @@ def demo_numeric_constraints():
 # EXAMPLE 7: ALLOF (INHERITANCE/COMPOSITION)
 # =============================================================================
 
+@buffered_demo
 def demo_allof():
     """Demonstrate allOf for composition/inheritance."""
     print_header("EXAMPLE 7: ALLOF (COMPOSITION)")
@@ -529,6 +585,7 @@ def demo_allof():
 # EXAMPLE 8: ONEOF (UNION TYPES)
 # =============================================================================
 
+@buffered_demo
 def demo_oneof():
     """Demonstrate oneOf for union types."""
     print_header("EXAMPLE 8: ONEOF (UNION TYPES)")
@@ -600,6 +657,7 @@ def demo_oneof():
 # EXAMPLE 9: ANYOF (FLEXIBLE TYPES)
 # =============================================================================
 
+@buffered_demo
 def demo_anyof():
     """Demonstrate anyOf for flexible types."""
     print_header("EXAMPLE 9: ANYOF (FLEXIBLE TYPES)")
@@ -661,6 +719,7 @@ def demo_anyof():
 # EXAMPLE 10: DEFINITIONS AND REFERENCES
 # =============================================================================
 
+@buffered_demo
 def demo_definitions():
     """Demonstrate $defs/$definitions and $ref."""
     print_header("EXAMPLE 10: DEFINITIONS AND REFERENCES")
@@ -733,6 +792,7 @@ def demo_definitions():
 # EXAMPLE 11: ADDITIONAL PROPERTIES
 # =============================================================================
 
+@buffered_demo
 def demo_additional_properties():
     """Demonstrate additionalProperties handling."""
     print_header("EXAMPLE 11: ADDITIONAL PROPERTIES")
@@ -789,6 +849,7 @@ def demo_additional_properties():
 # EXAMPLE 12: CONDITIONAL SCHEMAS (IF/THEN/ELSE)
 # =============================================================================
 
+@buffered_demo
 def demo_conditional():
     """Demonstrate conditional schemas."""
     print_header("EXAMPLE 12: CONDITIONAL SCHEMAS")
@@ -841,6 +902,7 @@ def demo_conditional():
 # EXAMPLE 13: COMPLEX E-COMMERCE SCHEMA
 # =============================================================================
 
+@buffered_demo
 def demo_ecommerce():
     """Demonstrate a complex real-world e-commerce schema."""
     print_header("EXAMPLE 13: COMPLEX E-COMMERCE SCHEMA")
@@ -957,6 +1019,7 @@ def demo_ecommerce():
 # EXAMPLE 14: API RESPONSE SCHEMA
 # =============================================================================
 
+@buffered_demo
 def demo_api_response():
     """Demonstrate API response schema patterns."""
     print_header("EXAMPLE 14: API RESPONSE PATTERNS")
@@ -1047,6 +1110,7 @@ def demo_api_response():
 # EXAMPLE 15: VALIDATION DEMONSTRATION
 # =============================================================================
 
+@buffered_demo
 def demo_validation():
     """Demonstrate validation capabilities."""
     print_header("EXAMPLE 15: VALIDATION")
@@ -1090,37 +1154,39 @@ def demo_validation():
     # Invalid data examples
     print_subheader("Validating Invalid Data")
     
-    invalid_examples = [
-        {
-            "name": "Missing required field",
-            "data": {"username": "john", "email": "john@example.com"}
-        },
-        {
-            "name": "Invalid email format",
-            "data": {"username": "john", "email": "not-an-email", "password": "pass1234", "acceptedTerms": True}
-        },
-        {
-            "name": "Username too short",
-            "data": {"username": "jo", "email": "john@example.com", "password": "pass1234", "acceptedTerms": True}
-        },
-        {
-            "name": "Invalid username pattern",
-            "data": {"username": "John-Doe", "email": "john@example.com", "password": "pass1234", "acceptedTerms": True}
-        },
-        {
-            "name": "Password too short",
-            "data": {"username": "john_doe", "email": "john@example.com", "password": "short", "acceptedTerms": True}
-        },
-        {
-            "name": "Age below minimum",
-            "data": {"username": "john_doe", "email": "john@example.com", "password": "pass1234", "age": 15, "acceptedTerms": True}
-        }
-    ]
-    
-    for example in invalid_examples:
-        print(f"\n{example['name']}:")
-        print(f"  Data: {json.dumps(example['data'])}")
-        result = processor.validate_data(example['data'])
+    invalid_examples = (
+        (
+            "Missing required field",
+            {"username": "john", "email": "john@example.com"},
+        ),
+        (
+            "Invalid email format",
+            {"username": "john", "email": "not-an-email", "password": "pass1234", "acceptedTerms": True},
+        ),
+        (
+            "Username too short",
+            {"username": "jo", "email": "john@example.com", "password": "pass1234", "acceptedTerms": True},
+        ),
+        (
+            "Invalid username pattern",
+            {"username": "John-Doe", "email": "john@example.com", "password": "pass1234", "acceptedTerms": True},
+        ),
+        (
+            "Password too short",
+            {"username": "john_doe", "email": "john@example.com", "password": "short", "acceptedTerms": True},
+        ),
+        (
+            "Age below minimum",
+            {"username": "john_doe", "email": "john@example.com", "password": "pass1234", "age": 15, "acceptedTerms": True},
+        ),
+    )
+    
+    dumped = [json.dumps(data) for _, data in invalid_examples]
+    
+    for (name, data), data_json in zip(invalid_examples, dumped):
+        print(f"\n{name}:")
+        print(f"  Data: {data_json}")
+        result = processor.validate_data(data)
         print(f"  Valid: {result.is_valid}")
         if not result.is_valid:
             for issue in result.issues[:2]:
@@ -1131,6 +1197,7 @@ def demo_validation():
 # EXAMPLE 16: SCHEMA VALIDATOR
 # =============================================================================
 
+@buffered_demo
 def demo_schema_validator():
     """Demonstrate schema validation."""
     print_header("EXAMPLE 16: SCHEMA VALIDATION")
@@ -1182,6 +1249,7 @@ def demo_schema_validator():
 # EXAMPLE 17: TYPE MAPPER
 # =============================================================================
 
+@buffered_demo
 def demo_type_mapper():
     """Demonstrate type mapping from JSON Schema to Python."""
     print_header("EXAMPLE 17: TYPE MAPPING")
@@ -1222,6 +1290,7 @@ def demo_type_mapper():
 # EXAMPLE 18: CODE GENERATOR OPTIONS
 # =============================================================================
 
+@buffered_demo
 def demo_code_generator_options():
     """Demonstrate different code generation options."""
     print_header("EXAMPLE 18: CODE GENERATOR OPTIONS")
@@ -1236,14 +1305,14 @@ def demo_code_generator_options():
         }
     }
     
-    print_subheader("Default Dataclass Style")
     generator = CodeGenerator(schema, root_class_name="Config", style="dataclass")
-    code = generator.generate()
+    
+    print_subheader("Default Dataclass Style")
+    code = generator.generate(include_validators=True)
     print_code(code, 40)
     
     print_subheader("Without Validators")
-    generator = CodeGenerator(schema, root_class_name="Config", include_validators=False)
-    code = generator.generate()
+    code = generator.generate(include_validators=False)
     print_code(code, 30)
 
 
@@ -1251,6 +1320,7 @@ def demo_code_generator_options():
 # EXAMPLE 19: SAMPLE GENERATOR OPTIONS
 # =============================================================================
 
+@buffered_demo
 def demo_sample_generator_options():
     """Demonstrate sample generation options."""
     print_header("EXAMPLE 19: SAMPLE GENERATOR OPTIONS")
@@ -1271,24 +1341,25 @@ def demo_sample_generator_options():
     processor = SchemaProcessor(schema)
     samples = processor.generate_samples(count=3, use_faker=True)
     for i, sample in enumerate(samples, 1):
-        print(f"Sample {i}: {json.dumps(sample, default=str)}")
+        print(f"Sample {i}: {_COMPACT(sample)}")
     
     print_subheader("Without Faker (Random Data)")
     samples = processor.generate_samples(count=3, use_faker=False)
     for i, sample in enumerate(samples, 1):
-        print(f"Sample {i}: {json.dumps(sample, default=str)}")
+        print(f"Sample {i}: {_COMPACT(sample)}")
 
 
 # =============================================================================
 # EXAMPLE 20: MODULE GENERATION
 # =============================================================================
 
+@buffered_demo
 def demo_module_generation():
     """Demonstrate module generation from schema folder."""
     print_header("EXAMPLE 20: MODULE GENERATION")
     
-    examples_dir = Path(__file__).parent / "examples" / "schemas"
-    output_dir = Path(__file__).parent / "demo_output"
+    examples_dir = _EXAMPLES_DIR
+    output_dir = _DEMO_OUTPUT
     
     if not examples_dir.exists():
         print(f"Examples directory not found: {examples_dir}")
@@ -1329,7 +1400,7 @@ def demo_module_generation():
         
         print("\n  Generated files structure:")
         module_path = Path(result['module_path'])
-        for f in sorted(module_path.rglob("*.py"))[:20]:
+        for f in heapq.nsmallest(20, module_path.rglob("*.py")):
             rel_path = f.relative_to(output_dir)
             print(f"    {rel_path}")
         
@@ -1352,11 +1423,12 @@ def demo_module_generation():
 # EXAMPLE 21: WORKING WITH EXTERNAL SCHEMAS
 # =============================================================================
 
+@buffered_demo
 def demo_external_schemas():
     """Demonstrate loading schemas from files."""
     print_header("EXAMPLE 21: LOADING EXTERNAL SCHEMAS")
     
-    examples_dir = Path(__file__).parent / "examples" / "schemas"
+    examples_dir = _EXAMPLES_DIR
     
     if not examples_dir.exists():
         print(f"Examples directory not found: {examples_dir}")
@@ -1364,8 +1436,8 @@ def demo_external_schemas():
     
     # List available schemas
     print_subheader("Available Example Schemas")
-    schemas = sorted(examples_dir.glob("*.json"))
-    for schema_path in schemas[:15]:
+    schemas = list(examples_dir.glob("*.json"))
+    for schema_path in heapq.nsmallest(15, schemas):
         print(f"  - {schema_path.name}")
     if len(schemas) > 15:
         print(f"  ... and {len(schemas) - 15} more")
@@ -1395,6 +1467,7 @@ def demo_external_schemas():
 # EXAMPLE 22: RECURSIVE SCHEMAS
 # =============================================================================
 
+@buffered_demo
 def demo_recursive_schemas():
     """Demonstrate handling of recursive schemas."""
     print_header("EXAMPLE 22: RECURSIVE SCHEMAS")
@@ -1447,6 +1520,7 @@ def demo_recursive_schemas():
 # EXAMPLE 23: COMPLEX NESTED STRUCTURES
 # =============================================================================
 
+@buffered_demo
 def demo_complex_nested():
     """Demonstrate deeply nested structures."""
     print_header("EXAMPLE 23: COMPLEX NESTED STRUCTURES")
@@ -1520,6 +1594,15 @@ def demo_complex_nested():
 # MAIN EXECUTION
 # =============================================================================
 
+def _run_demo(demo_func) -> Tuple[bool, Optional[Exception]]:
+    """Run a single demo, returning (ok, error) instead of raising."""
+    try:
+        demo_func()
+    except Exception as e:
+        return False, e
+    return True, None
+
+
 def main():
     """Run all demonstrations."""
     print("=" * 78)
@@ -1560,13 +1643,13 @@ def main():
     failed = 0
     
     for name, demo_func in demos:
-        try:
-            demo_func()
+        ok, error = _run_demo(demo_func)
+        if ok:
             successful += 1
-        except Exception as e:
-            print(f"\n[ERROR] Error during '{name}': {e}")
+        else:
+            print(f"\n[ERROR] Error during '{name}': {error}")
             import traceback
-            traceback.print_exc()
+            traceback.print_exception(type(error), error, error.__traceback__)
             failed += 1
     
     print_header("DEMONSTRATION COMPLETE")
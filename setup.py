@@ -37,7 +37,8 @@ setup(
         "faker": ["faker>=18.0.0"],
         "requests": ["requests>=2.28.0"],
         "validation": ["jsonschema>=4.17.0"],
-        "all": ["faker>=18.0.0", "requests>=2.28.0", "jsonschema>=4.17.0"],
+        "fast": ["orjson>=3.9.0", "ijson>=3.1"],
+        "all": ["faker>=18.0.0", "requests>=2.28.0", "jsonschema>=4.17.0", "orjson>=3.9.0", "ijson>=3.1"],
         "dev": [
             "faker>=18.0.0",
             "requests>=2.28.0", 
@@ -61,6 +62,7 @@ setup(
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
+        # 3.10+ also gets slotted dataclasses from generate-module --slots
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
@@ -0,0 +1,261 @@
+"""
+Generated Module - Tests
+
+Copyright (C) 2025-2030, All Rights Reserved
+Ashutosh Sinha
+Email: ajsinha@gmail.com
+"""
+
+import importlib
+import json
+import sys
+from dataclasses import fields
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from jsonchamp.module_generator import ModuleGenerator
+
+
+EXAMPLE_SCHEMAS = Path(__file__).resolve().parent.parent / "examples" / "schemas"
+
+NODE_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "Node",
+    "type": "object",
+    "properties": {
+        "label": {"type": "string"},
+        "parent": {"$ref": "#"},
+        "children": {"type": "array", "items": {"$ref": "#"}},
+    },
+    "required": ["label"],
+}
+
+EVENT_ID = "6f1c2b9e-3f4a-4c8d-9e2b-7a1d5c3e9f01"
+
+
+def _generated_module(tmp_path_factory, schema_dir, module_name, **options):
+    """
+    Generate a module from schema_dir and import it, unloading it afterwards.
+    
+    The output directory stays on sys.path while the module is in use, so
+    sample worker processes can import it too.
+    """
+    out_dir = str(tmp_path_factory.mktemp(module_name))
+    results = ModuleGenerator(str(schema_dir), out_dir, module_name, **options).generate()
+    assert results["errors"] == []
+    
+    sys.path.insert(0, out_dir)
+    try:
+        yield importlib.import_module(module_name)
+    finally:
+        sys.path.remove(out_dir)
+        for name in list(sys.modules):
+            if name == module_name or name.startswith(module_name + "."):
+                del sys.modules[name]
+
+
+@pytest.fixture(scope="module")
+def models(tmp_path_factory):
+    yield from _generated_module(tmp_path_factory, EXAMPLE_SCHEMAS, "example_models")
+
+
+@pytest.fixture(scope="module")
+def slot_models(tmp_path_factory):
+    yield from _generated_module(tmp_path_factory, EXAMPLE_SCHEMAS, "example_slot_models", use_slots=True)
+
+
+@pytest.fixture(scope="module")
+def node_module(tmp_path_factory):
+    schema_dir = tmp_path_factory.mktemp("node_schemas")
+    (schema_dir / "node.json").write_text(json.dumps(NODE_SCHEMA), encoding="utf-8")
+    yield from _generated_module(tmp_path_factory, schema_dir, "selfref_models")
+
+
+def test_renamed_fields_round_trip(models):
+    """JSON names are mapped to Python names on load and back on dump."""
+    from example_models.driver import load_dict, to_dict
+    from example_models.generated.event import Event
+    
+    event = load_dict({"id": EVENT_ID, "title": "Launch", "allDay": True}, Event)
+    
+    assert (event.id_, event.title, event.allDay) == (EVENT_ID, "Launch", True)
+    data = to_dict(event)
+    assert data["id"] == EVENT_ID and "id_" not in data
+    assert to_dict(load_dict(data, Event)) == data
+    # The Python name is accepted as well
+    assert load_dict({"id_": EVENT_ID}, Event).id_ == EVENT_ID
+
+
+def test_nested_and_list_fields_round_trip(models):
+    """Nested dataclasses and lists of dates are converted both ways."""
+    from example_models.driver import load_dict, to_dict
+    from example_models.generated.event import Event, Location, Recurrence
+    
+    source = {
+        "title": "Standup",
+        "location": {"name": "Room 1", "virtual": False},
+        "recurrence": {"daysOfWeek": ["MO", "WE"], "until": "2025-01-01",
+                       "exceptions": ["2024-12-25", "2024-12-26"]},
+    }
+    
+    event = load_dict(source, Event)
+    
+    assert isinstance(event.location, Location) and event.location.name == "Room 1"
+    assert isinstance(event.recurrence, Recurrence)
+    assert event.recurrence.daysOfWeek == ["MO", "WE"]
+    assert event.recurrence.until == date(2025, 1, 1)
+    assert event.recurrence.exceptions == [date(2024, 12, 25), date(2024, 12, 26)]
+    
+    data = to_dict(event)
+    assert data["recurrence"]["exceptions"] == ["2024-12-25", "2024-12-26"]
+    assert data["location"]["name"] == "Room 1"
+    assert load_dict(data, Event) == event
+
+
+def test_datetime_uuid_and_decimal_values(models):
+    """Datetimes are parsed on load; datetimes, UUIDs and Decimals dump as strings."""
+    from example_models.driver import load_dict, to_dict, to_json_string
+    from example_models.generated.event import Event
+    from example_models.generated.financial_transaction import FinancialTransaction
+    
+    event = load_dict({"start": "2024-05-01T09:30:00Z"}, Event)
+    assert event.start == datetime(2024, 5, 1, 9, 30, tzinfo=timezone.utc)
+    
+    event = Event(id_=UUID(EVENT_ID), start=datetime(2024, 5, 1, 9, 30))
+    data = to_dict(event)
+    assert data["id"] == EVENT_ID
+    assert data["start"] == "2024-05-01T09:30:00"
+    assert to_dict(load_dict(data, Event)) == data
+    
+    transaction = FinancialTransaction(metadata={
+        "fee": Decimal("12.50"), "batch": UUID(EVENT_ID), "booked": date(2024, 5, 1),
+    })
+    expected = {"fee": "12.50", "batch": EVENT_ID, "booked": "2024-05-01"}
+    assert to_dict(transaction)["metadata"] == expected
+    assert json.loads(to_json_string(transaction))["metadata"] == expected
+
+
+def test_flat_class_fast_path(models):
+    """Flat classes load the same with and without unknown keys."""
+    from example_models.driver import load_dict, to_dict
+    from example_models.generated.order import Address
+    
+    source = {"firstName": "Ada", "city": "London", "postalCode": "N1"}
+    
+    address = load_dict(source, Address)
+    
+    assert address == Address(**source)
+    assert load_dict(dict(source, unknown="ignored"), Address) == address
+    assert load_dict(to_dict(address), Address) == address
+
+
+def test_slotted_classes_round_trip(models, slot_models):
+    """Classes generated with __slots__ load and dump like regular ones."""
+    from example_models.driver import load_dict, to_dict
+    from example_models.generated.event import Event
+    from example_slot_models import driver as slot_driver
+    from example_slot_models.generated.event import Event as SlotEvent
+    
+    source = {"id": EVENT_ID, "title": "Launch", "location": {"name": "Hall"},
+              "recurrence": {"exceptions": ["2024-12-25"]}}
+    
+    event = slot_driver.load_dict(source, SlotEvent)
+    
+    assert "__slots__" in vars(SlotEvent)
+    assert not hasattr(event, "__dict__")
+    assert slot_driver.get_class_info("Event")["slots"] is True
+    assert slot_driver.to_dict(event) == to_dict(load_dict(source, Event))
+
+
+def test_self_referencing_class_round_trip(node_module):
+    """A class that refers to itself loads and dumps at any depth."""
+    from selfref_models.driver import load_dict, to_dict
+    from selfref_models.generated.node import Node
+    
+    source = {"label": "root", "parent": {"label": "up"},
+              "children": [{"label": "a", "children": [{"label": "a1"}]}, {"label": "b"}]}
+    
+    node = load_dict(source, Node)
+    
+    assert isinstance(node.parent, Node) and node.parent.label == "up"
+    assert [child.label for child in node.children] == ["a", "b"]
+    assert isinstance(node.children[0].children[0], Node)
+    assert load_dict(to_dict(node), Node) == node
+
+
+def test_sample_of_self_referencing_class(node_module):
+    """Fields that re-enter the class being sampled are left empty."""
+    from selfref_models.main import generate_sample
+    
+    sample = generate_sample("Node", seed=1)
+    
+    assert isinstance(sample.label, str)
+    assert sample.parent is None
+    assert sample.children == []
+
+
+def test_seeded_samples_repeat(models):
+    """The compiled sample factory is driven only by the seed."""
+    from example_models.driver import to_dict
+    from example_models.generated.order import Address
+    from example_models.main import generate_sample, generate_sample_for_class
+    
+    first = generate_sample_for_class(Address, seed=5)
+    
+    assert [f.name for f in fields(first) if getattr(first, f.name) is None] == []
+    assert generate_sample_for_class(Address, seed=5) == first
+    assert to_dict(generate_sample("GameEntity", seed=3)) == to_dict(generate_sample("GameEntity", seed=3))
+
+
+def test_sample_cli_jsonl_matches_array_and_workers(models, tmp_path):
+    """--jsonl, array output and -j all produce the same seeded samples."""
+    from example_models.main import PARALLEL_SAMPLE_MIN_COUNT, run_cli
+    
+    base = ["sample", "GameEntity", "-n", str(PARALLEL_SAMPLE_MIN_COUNT), "--seed", "11"]
+    array_path, jsonl_path, parallel_path = (tmp_path / name for name in ("a.json", "s.jsonl", "p.jsonl"))
+    
+    assert run_cli(base + ["-o", str(array_path)]) == 0
+    assert run_cli(base + ["--jsonl", "-o", str(jsonl_path)]) == 0
+    assert run_cli(base + ["--jsonl", "-j", "2", "-o", str(parallel_path)]) == 0
+    
+    records = json.loads(array_path.read_bytes())
+    assert len(records) == PARALLEL_SAMPLE_MIN_COUNT
+    assert [json.loads(line) for line in jsonl_path.read_bytes().splitlines()] == records
+    assert parallel_path.read_bytes() == jsonl_path.read_bytes()
+
+
+@pytest.mark.parametrize("load", ["load_json_file", "load_json_large"])
+def test_load_keeps_wide_integers_and_nan(node_module, tmp_path, load):
+    """Integers past 64 bits stay exact and NaN is accepted, with or without orjson."""
+    from selfref_models import driver
+    
+    path = tmp_path / "node.json"
+    path.write_text('{"label": "n", "parent": {"label": 123456789012345678901234567890}, '
+                    '"children": [{"label": NaN}]}', encoding="utf-8")
+    
+    node = getattr(driver, load)(path, driver.get_class("Node"))
+    
+    assert node.parent.label == 123456789012345678901234567890
+    assert node.children[0].label != node.children[0].label
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_dump_keeps_nan_and_infinity(node_module, indent):
+    """Non-finite floats are written as NaN/Infinity, with or without orjson."""
+    from selfref_models.driver import HAS_ORJSON, load_dict, to_dict, to_json_string
+    from selfref_models.generated.node import Node
+    
+    node = load_dict({"label": float("inf"), "parent": {"label": None},
+                      "children": [{"label": float("nan")}, {"label": float("-inf")}]}, Node)
+    
+    text = to_json_string(node, indent)
+    
+    separators = (",", ":") if indent is None and HAS_ORJSON else None
+    assert text == json.dumps(to_dict(node), indent=indent, separators=separators)
+    restored = load_dict(json.loads(text), Node)
+    assert restored.label == float("inf") and restored.parent.label is None
+    assert restored.children[0].label != restored.children[0].label
+    assert restored.children[1].label == float("-inf")
@@ -0,0 +1,242 @@
+"""
+Transformation Runners - Tests
+
+Copyright (C) 2025-2030, All Rights Reserved
+Ashutosh Sinha
+Email: ajsinha@gmail.com
+"""
+
+import concurrent.futures
+import io
+import json
+import sys
+
+import pytest
+from jsonchamp.transformation.utils.runner import (
+    DYNAMIC_FIELDS, HAS_ORJSON, TRANSFORM_CHUNK_SIZE, load_transformer, output_stream,
+    parallel_transform, parse_json, stable_hash, write_json, write_json_array, write_records
+)
+
+import transform
+import transform_dict
+import transform_xml
+
+
+ITEMS = [
+    {"id": i, "name": f"item {i}", "tags": ["a", "b"], "nested": {"x": [1, {"y": None}]}}
+    for i in range(3)
+]
+
+# CSV cells such as NaN and inf become non-finite floats
+NON_FINITE_ITEMS = [
+    {"id": 1, "score": float("nan"), "note": None},
+    {"id": 2, "score": float("inf")},
+    {"id": 3, "scores": [1.5, {"low": float("-inf")}]},
+]
+
+
+@pytest.mark.parametrize("items", [ITEMS, NON_FINITE_ITEMS], ids=["finite", "non_finite"])
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_write_json_array_matches_json_dumps(indent, items):
+    """The streamed array has the same layout as json.dumps of the whole list."""
+    out = io.BytesIO()
+    
+    count = write_json_array(out, iter(items), indent)
+    
+    assert count == len(items)
+    if indent is None and HAS_ORJSON:
+        expected = json.dumps(items, separators=(",", ":"))
+    else:
+        expected = json.dumps(items, indent=indent)
+    assert out.getvalue().decode("utf-8") == expected
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_write_json_keeps_nan_and_infinity(indent):
+    """Non-finite floats are written as NaN/Infinity, with or without orjson."""
+    out = io.BytesIO()
+    
+    write_json(out, NON_FINITE_ITEMS, indent)
+    
+    text = out.getvalue().decode("utf-8")
+    assert "NaN" in text and "-Infinity" in text and "null" in text
+    assert json.dumps(json.loads(text)) == json.dumps(NON_FINITE_ITEMS)
+
+
+def test_write_json_array_nested_in_wrapper():
+    """At level 1 the array lines up inside the --wrap-array object."""
+    out = io.BytesIO()
+    out.write(b'{\n  "records": ')
+    count = write_json_array(out, iter(ITEMS), 2, level=1)
+    out.write(f',\n  "count": {count}\n}}'.encode("utf-8"))
+    
+    expected = json.dumps({"records": ITEMS, "count": len(ITEMS)}, indent=2)
+    assert out.getvalue().decode("utf-8") == expected
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_write_json_array_empty(indent):
+    """No items still writes an empty array."""
+    out = io.BytesIO()
+    
+    assert write_json_array(out, iter([]), indent) == 0
+    assert out.getvalue() == b"[]"
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_write_records_wrap_array(indent):
+    """--wrap-array output parses to the records and their count."""
+    out = io.BytesIO()
+    
+    count = write_records(out, iter(ITEMS), indent, wrap_array=True)
+    
+    assert count == len(ITEMS)
+    assert json.loads(out.getvalue()) == {"records": ITEMS, "count": len(ITEMS)}
+
+
+def test_write_records_validates_each_record():
+    """Every record passes through validate before it is written."""
+    seen = []
+    out = io.BytesIO()
+    
+    write_records(out, iter(ITEMS), validate=seen.append)
+    
+    assert seen == ITEMS
+    assert json.loads(out.getvalue()) == ITEMS
+
+
+def test_output_stream_removes_partial_file(tmp_path):
+    """A failure while writing leaves no truncated output file behind."""
+    path = tmp_path / "out.json"
+    
+    def failing():
+        yield ITEMS[0]
+        raise ValueError("bad record")
+    
+    with pytest.raises(ValueError):
+        with output_stream(str(path)) as out:
+            write_records(out, failing())
+    
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_xml_runner_output_matches_json_dumps(tmp_path, monkeypatch, indent):
+    """transform_xml.py writes NaN/Infinity cells as json.dumps does."""
+    mapping = tmp_path / "items.smap"
+    mapping.write_text("id : id\nscore : score\n", encoding="utf-8")
+    source = tmp_path / "items.xml"
+    source.write_text("<items><item><id>1</id><score>NaN</score></item>"
+                      "<item><id>2</id><score>-inf</score></item>"
+                      "<item><id>3</id><score>2.5</score></item></items>", encoding="utf-8")
+    output = tmp_path / "out.json"
+    layout = ["--pretty"] if indent else ["--compact"]
+    monkeypatch.setattr(sys, "argv", ["transform_xml.py", str(mapping), str(source), "-r", "item",
+                                      "--no-mapping-cache", "--quiet", "-o", str(output)] + layout)
+    
+    with pytest.raises(SystemExit) as exit_info:
+        transform_xml.main()
+    
+    assert exit_info.value.code == 0
+    expected = [{"id": 1, "score": float("nan")}, {"id": 2, "score": float("-inf")}, {"id": 3, "score": 2.5}]
+    separators = (",", ":") if indent is None and HAS_ORJSON else None
+    assert output.read_text(encoding="utf-8") == json.dumps(expected, indent=indent, separators=separators)
+
+
+@pytest.mark.parametrize("content", [
+    '{"id": 123456789012345678901234567890, "neg": -9999999999999999999}',
+    b'{"id": 123456789012345678901234567890, "neg": -9999999999999999999}',
+])
+def test_parse_json_keeps_wide_integers_exact(content):
+    """Integers orjson would round to floats are parsed exactly."""
+    assert parse_json(content) == {"id": 123456789012345678901234567890, "neg": -9999999999999999999}
+
+
+def test_parse_json_accepts_nan():
+    """NaN, which orjson rejects, parses as with the standard library."""
+    value = parse_json(b'{"a": NaN}')["a"]
+    
+    assert value != value
+
+
+def test_transform_load_json_is_lossless(tmp_path):
+    """transform.py reads NaN and wide integers like the standard library."""
+    path = tmp_path / "in.json"
+    path.write_text('{"a": NaN, "id": 123456789012345678901234567890}', encoding="utf-8")
+    
+    data = transform._load_json(str(path))
+    
+    assert data["id"] == 123456789012345678901234567890
+    assert data["a"] != data["a"]
+
+
+def test_transform_cbor_cache_write_failure_is_ignored(tmp_path):
+    """An unwritable CBOR copy leaves the cache unused and no temp file behind."""
+    pytest.importorskip("cbor2")
+    path = tmp_path / "in.json"
+    path.write_text('{"a": 1}', encoding="utf-8")
+    # A directory in the cache's place makes the final rename fail
+    (tmp_path / "in.json.cbor").mkdir()
+    
+    assert transform._load_json(str(path), cache_binary=True) == {"a": 1}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["in.json", "in.json.cbor"]
+
+
+def test_stable_hash_ignores_dynamic_fields_and_key_order():
+    """Outputs equal apart from dynamic fields and key order hash the same."""
+    dynamic = {name: "run 1" for name in DYNAMIC_FIELDS}
+    result_a = {"id": 1, "items": [{"x": 2.0, **dynamic}], **dynamic}
+    result_b = {"items": [{"x": 2}], "id": 1, "transformedAt": "run 2"}
+    
+    assert stable_hash(result_a) == stable_hash(result_b)
+    assert stable_hash(result_a) != stable_hash({"id": 1, "items": [{"x": 3}]})
+    assert stable_hash({"a": [1]}) != stable_hash({"a": (1,)})
+
+
+@pytest.fixture
+def mapping_file(tmp_path):
+    path = tmp_path / "m.smap"
+    path.write_text("id : id\nname : label\n", encoding="utf-8")
+    return str(path)
+
+
+def test_parallel_transform_keeps_input_order(mapping_file):
+    """Results from several workers come back in input order."""
+    transformer = load_transformer(mapping_file)
+    records = [{"id": i, "name": f"n{i}"} for i in range(3 * TRANSFORM_CHUNK_SIZE + 7)]
+    
+    results = list(parallel_transform(iter(records), transformer, (mapping_file,), workers=2))
+    
+    assert results == transformer.transform_batch(records)
+
+
+def test_parallel_transform_runs_one_chunk_in_process(mapping_file, monkeypatch):
+    """Inputs of one chunk or less never start a pool."""
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", None)
+    transformer = load_transformer(mapping_file)
+    records = [{"id": i, "name": f"n{i}"} for i in range(TRANSFORM_CHUNK_SIZE)]
+    
+    results = list(parallel_transform(iter(records), transformer, (mapping_file,), workers=2))
+    
+    assert results == transformer.transform_batch(records)
+
+
+def test_compiled_class_cache_follows_mapping_and_compiler(tmp_path, monkeypatch):
+    """Generated modules are rebuilt when the mapping or the compiler changes."""
+    cache_dir = tmp_path / "compiled"
+    monkeypatch.setattr(transform_dict, "COMPILED_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(transform_dict, "_CLASS_CACHE", {})
+    mapping = tmp_path / "m.smap"
+    mapping.write_text("a : b\n", encoding="utf-8")
+    wrapper = transform_dict.CompiledTransformerWrapper
+    
+    assert wrapper(str(mapping)).transform({"a": 1}) == {"b": 1}
+    assert len(list(cache_dir.glob("*.py"))) == 1
+    
+    mapping.write_text("a : changed\n", encoding="utf-8")
+    assert wrapper(str(mapping)).transform({"a": 1}) == {"changed": 1}
+    assert len(list(cache_dir.glob("*.py"))) == 2
+    
+    monkeypatch.setattr(transform_dict, "_compiler_fingerprint", lambda: "other generator")
+    assert wrapper(str(mapping)).transform({"a": 1}) == {"changed": 1}
+    assert len(list(cache_dir.glob("*.py"))) == 3
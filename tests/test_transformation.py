@@ -0,0 +1,159 @@
+"""
+SchemaMap Transformation - Tests
+
+Copyright (C) 2025-2030, All Rights Reserved
+Ashutosh Sinha
+Email: ajsinha@gmail.com
+"""
+
+import pickle
+
+import pytest
+from jsonchamp.transformation import (
+    SchemaMapParser, SchemaMapTransformer, PythonCodeGenerator, XMLConverter, load_mapping
+)
+from jsonchamp.transformation.converters import FLRConverter, RecordLayout
+
+
+def _compile_class(source, specimen=None):
+    """Generate and exec a transformer class for mapping source."""
+    mapping_file = SchemaMapParser().parse(source)
+    code = PythonCodeGenerator(class_name="T").generate(mapping_file, specimen=specimen)
+    namespace = {}
+    exec(compile(code, "<generated>", "exec"), namespace)
+    return namespace["T"]
+
+
+def test_specialized_reads_match_generic_for_other_shapes():
+    """Records shaped unlike the specimen get the generic lookup result."""
+    source = "tags[0] : firstTag\nuser.name : name\n"
+    specimen = {"tags": ["x"], "user": {"name": "n"}}
+    specialized = _compile_class(source, specimen)()
+    generic = _compile_class(source)()
+    
+    records = [
+        {"tags": ["x", "y"], "user": {"name": "a"}},
+        {"tags": "abc", "user": "zz"},
+        {"tags": [], "user": None},
+        {"tags": {"0": "k"}},
+        {},
+    ]
+    
+    for record in records:
+        assert specialized.transform(record) == generic.transform(record)
+    assert specialized.transform_batch(records) == generic.transform_batch(records)
+    assert specialized.transform({"tags": "abc"})["firstTag"] == "abc"
+
+
+def test_compiled_flr_parser_converts_each_field_type():
+    """The generated record parser applies every field option of the layout."""
+    layout = RecordLayout()
+    layout.add_field("id", 1, 5, data_type="integer")
+    layout.add_field("amount", 6, 7, data_type="decimal", decimal_places=2)
+    layout.add_field("rate", 13, 5, data_type="decimal")
+    layout.add_field("active", 18, 1, data_type="boolean")
+    layout.add_field("born", 19, 8, data_type="date", date_format="DDMMYYYY")
+    layout.add_field("code", 27, 4, null_value="NONE")
+    layout.add_field("raw", 31, 4, trim=False)
+    converter = FLRConverter(layout)
+    
+    assert converter.convert_record("00042  12345 1.5 Y31121999NONE ab ") == {
+        "id": 42, "amount": 123.45, "rate": 1.5, "active": True,
+        "born": "1999-12-31", "code": None, "raw": " ab ",
+    }
+    assert converter.convert_record("   -7      5     T0101200X  Z") == {
+        "id": -7, "amount": 0.5, "rate": None, "active": True,
+        "born": "200X-01-01", "code": "Z", "raw": None,
+    }
+    assert converter.convert_record("abc  12.3x  nope n1999    ABCD") == {
+        "id": None, "amount": None, "rate": None, "active": False,
+        "born": "1999", "code": "ABCD", "raw": None,
+    }
+
+
+NESTED_XML = """<?xml version="1.0"?>
+<catalog>
+  <items>
+    <item sku="A1"><name>First</name><price>1.50</price></item>
+    <item sku="A2"><name>Second</name><tags><tag>x</tag><tag>y</tag></tags></item>
+  </items>
+  <archive>
+    <items>
+      <item sku="B1"><name>Old</name><item sku="B1a"><name>Inner</name></item></item>
+    </items>
+  </archive>
+  <item sku="C1"><name>Loose</name></item>
+</catalog>
+"""
+
+
+@pytest.mark.parametrize("element_path", [
+    "item", "items/item", "*/item", "archive/items/item", "tag", "tags/*", "catalog/items",
+])
+def test_iter_file_elements_matches_findall(tmp_path, element_path):
+    """Streamed record matching agrees with the findall-based converter."""
+    xml_file = tmp_path / "catalog.xml"
+    xml_file.write_text(NESTED_XML, encoding="utf-8")
+    converter = XMLConverter()
+    
+    streamed = list(converter.iter_file_elements(xml_file, element_path))
+    
+    assert streamed == converter.convert_elements(NESTED_XML, element_path)
+    assert converter.convert_file_elements(xml_file, element_path) == streamed
+
+
+def test_transform_many_matches_transform_batch():
+    """transform_many yields what transform_batch and transform return, in order."""
+    mapping = SchemaMapParser().parse("user.name : name\ntags[*] : tags\n")
+    transformer = SchemaMapTransformer(mapping)
+    items = [{"user": {"name": f"u{i}"}, "tags": [i, i + 1]} for i in range(50)]
+    
+    streamed = list(transformer.transform_many(iter(items)))
+    
+    assert streamed == transformer.transform_batch(items)
+    assert streamed == [transformer.transform(item) for item in items]
+
+
+def test_mapping_cache_reuses_entry_until_mapping_changes(tmp_path):
+    """The parsed-mapping cache is keyed on the file, so edits are picked up."""
+    mapping_file = tmp_path / "m.smap"
+    cache_dir = tmp_path / "cache"
+    mapping_file.write_text("a : b\n", encoding="utf-8")
+    
+    assert load_mapping(str(mapping_file), cache_dir).transform({"a": 1}) == {"b": 1}
+    assert load_mapping(str(mapping_file), cache_dir).transform({"a": 1}) == {"b": 1}
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+    
+    mapping_file.write_text("a : changed\n", encoding="utf-8")
+    
+    assert load_mapping(str(mapping_file), cache_dir).transform({"a": 1}) == {"changed": 1}
+    assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+
+def test_mapping_cache_follows_parser_source(tmp_path, monkeypatch):
+    """A changed lexer or parser source does not reuse pickles built by the old one."""
+    import jsonchamp.transformation as transformation
+    
+    mapping_file = tmp_path / "m.smap"
+    cache_dir = tmp_path / "cache"
+    mapping_file.write_text("a : b\n", encoding="utf-8")
+    
+    load_mapping(str(mapping_file), cache_dir)
+    monkeypatch.setattr(transformation, "_parser_fingerprint", lambda: "changed parser")
+    
+    assert load_mapping(str(mapping_file), cache_dir).transform({"a": 1}) == {"b": 1}
+    assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+
+def test_mapping_cache_write_failure_is_ignored(tmp_path, monkeypatch):
+    """A mapping that cannot be pickled still loads, leaving no cache files behind."""
+    def refuse(*args, **kwargs):
+        raise pickle.PicklingError("not picklable")
+    
+    monkeypatch.setattr(pickle, "dump", refuse)
+    mapping_file = tmp_path / "m.smap"
+    mapping_file.write_text("a : b\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    
+    assert load_mapping(str(mapping_file), cache_dir).transform({"a": 1}) == {"b": 1}
+    assert list(cache_dir.iterdir()) == []
@@ -0,0 +1,58 @@
+"""
+Schema Validator - Tests
+
+Copyright (C) 2025-2030, All Rights Reserved
+Ashutosh Sinha
+Email: ajsinha@gmail.com
+"""
+
+from jsonchamp.core.validator import SchemaValidator, NUMERIC_FAST_PATH_MIN_ITEMS
+
+
+def _issues(data, items_schema):
+    """Basic-validate data as an array of items_schema; return (path, rule) pairs."""
+    schema = {"type": "array", "items": items_schema}
+    result = SchemaValidator()._basic_validate(data, schema, "$")
+    return [(issue.path, issue.rule) for issue in result.issues]
+
+
+def _expected(data, minimum=None, maximum=None):
+    """Issues per-item validation reports, in index order."""
+    issues = []
+    for i, value in enumerate(data):
+        if minimum is not None and value < minimum:
+            issues.append((f"$[{i}]", "minimum"))
+        if maximum is not None and value > maximum:
+            issues.append((f"$[{i}]", "maximum"))
+    return issues
+
+
+def test_numeric_fast_path_reports_issues_in_index_order():
+    """Long arrays report minimum and maximum issues interleaved by index."""
+    data = [5, 50, -3, 7, 120, 0, 99, 101] * 8
+    assert len(data) > NUMERIC_FAST_PATH_MIN_ITEMS
+    
+    issues = _issues(data, {"type": "integer", "minimum": 0, "maximum": 100})
+    
+    assert issues == _expected(data, 0, 100)
+    assert {rule for _, rule in issues} == {"minimum", "maximum"}
+
+
+def test_numeric_fast_path_matches_per_item_for_crossed_bounds():
+    """An item below minimum and above maximum gets both issues, minimum first."""
+    data = [float(i) for i in range(40)]
+    
+    issues = _issues(data, {"type": "number", "minimum": 30, "maximum": 10})
+    
+    assert issues == _expected(data, 30, 10)
+
+
+def test_numeric_fast_path_keeps_large_integers_exact():
+    """Integers beyond 2**53 are compared exactly, as per-item validation does."""
+    limit = 2 ** 53
+    data = [limit - 1, limit, limit + 1] * 12
+    
+    issues = _issues(data, {"type": "integer", "maximum": limit})
+    
+    assert issues == _expected(data, maximum=limit)
+    assert issues[0] == ("$[2]", "maximum")
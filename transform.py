@@ -17,10 +17,14 @@ Usage:
     
     # Benchmark compiled vs interpreted
     python transform.py --benchmark mapping.smap input.json
+    
+    # Reuse a CBOR copy of a large input across runs (needs cbor2)
+    python transform.py --benchmark mapping.smap input.json --cache-binary
 """
 
 import argparse
 import json
+import os
 import sys
 import time
 from pathlib import Path
@@ -29,11 +33,68 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from jsonchamp.transformation import (
     transform, load_mapping, validate_json_schema,
-    ValidationError, TransformError, SchemaMapParser
+    ValidationError, TransformError, SchemaMapParser, SchemaMapTransformer
 )
 from jsonchamp.transformation.compiler.python_gen import PythonCodeGenerator
+from jsonchamp.transformation.utils.runner import output_stream, parse_json, stable_hash, write_json
 from jsonchamp import __version__
 
+try:
+    import cbor2
+    HAS_CBOR2 = True
+except ImportError:
+    HAS_CBOR2 = False
+
+
+def _load_json(path: str, cache_binary: bool = False):
+    """
+    Load a JSON file, parsing with orjson where it is exact (see parse_json).
+    
+    With cache_binary (and cbor2 installed) the parsed data is also saved
+    next to the input as <input>.cbor, and later runs read that copy
+    instead of re-parsing the JSON text while it is newer than the input.
+    """
+    cache_path = Path(str(path) + '.cbor')
+    if cache_binary and HAS_CBOR2:
+        if cache_path.exists() and cache_path.stat().st_mtime >= Path(path).stat().st_mtime:
+            try:
+                with open(cache_path, 'rb') as f:
+                    return cbor2.load(f)
+            except Exception:
+                # An unreadable or damaged copy is re-parsed from the JSON
+                pass
+    
+    with open(path, 'rb') as f:
+        data = parse_json(f.read())
+    
+    if cache_binary:
+        if HAS_CBOR2:
+            _write_cbor_cache(cache_path, data)
+        else:
+            print("Warning: --cache-binary needs cbor2 (pip install cbor2); reading JSON", file=sys.stderr)
+    return data
+
+
+def _write_cbor_cache(cache_path: Path, data) -> None:
+    """
+    Save data as the CBOR copy of an input file.
+    
+    The copy is written to a per-process temp file and moved into place,
+    so an interrupted run never leaves a truncated copy that looks newer
+    than the input. The cache is an optimization only; an unwritable
+    directory or data CBOR cannot encode just leaves it unused.
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            cbor2.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, cbor2.CBOREncodeError, TypeError, ValueError):
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
 
 def compile_to_python(mapping_path: str, output_path: str, class_name: str, verbose: bool = False):
     """Compile SchemaMap to standalone Python code."""
@@ -59,7 +120,8 @@ def compile_to_python(mapping_path: str, output_path: str, class_name: str, verb
         print(f"Lines: {code.count(chr(10)):,}")
 
 
-def run_benchmark(mapping_path: str, input_path: str, iterations: int = 10000, verbose: bool = False):
+def run_benchmark(mapping_path: str, input_path: str, iterations: int = 10000, verbose: bool = False,
+                  cache_binary: bool = False):
     """Benchmark interpreted vs compiled performance."""
     print("=" * 60)
     print("  SchemaMap Performance Benchmark")
@@ -67,26 +129,26 @@ def run_benchmark(mapping_path: str, input_path: str, iterations: int = 10000, v
     print("=" * 60)
     
     # Load test data
-    with open(input_path, 'r', encoding='utf-8') as f:
-        source_data = json.load(f)
+    source_data = _load_json(input_path, cache_binary)
     
     print(f"\nMapping file: {mapping_path}")
     print(f"Input file: {input_path}")
     print(f"Input size: {len(json.dumps(source_data)):,} bytes")
     print(f"Iterations: {iterations:,}")
     
-    # Create interpreted transformer
-    print("\n[1] Loading interpreted transformer...")
-    interpreted = load_mapping(mapping_path)
-    
-    # Compile to Python
-    print("[2] Compiling to Python code...")
+    # Parse the mapping once; both transformers are built from the same AST
     with open(mapping_path, 'r', encoding='utf-8') as f:
         content = f.read()
     
     parser = SchemaMapParser()
     mapping_file = parser.parse(content, filename=mapping_path)
     
+    # Create interpreted transformer
+    print("\n[1] Loading interpreted transformer...")
+    interpreted = SchemaMapTransformer(mapping_file)
+    
+    # Compile to Python
+    print("[2] Compiling to Python code...")
     generator = PythonCodeGenerator(class_name="CompiledTransformer")
     compiled_code = generator.generate(mapping_file)
     
@@ -101,16 +163,7 @@ def run_benchmark(mapping_path: str, input_path: str, iterations: int = 10000, v
     result_i = interpreted.transform(source_data)
     result_c = compiled.transform(source_data)
     
-    # Normalize for comparison (exclude dynamic fields)
-    def normalize(d):
-        if isinstance(d, dict):
-            return {k: normalize(v) for k, v in d.items() 
-                   if k not in ('transformedAt', 'transformationId', 'transformId')}
-        elif isinstance(d, list):
-            return [normalize(v) for v in d]
-        return d
-    
-    if normalize(result_i) == normalize(result_c):
+    if stable_hash(result_i) == stable_hash(result_c):
         print("    ✓ Outputs match!")
     else:
         print("    ⚠ Outputs differ (dynamic fields excluded)")
@@ -184,6 +237,9 @@ Examples:
   # Benchmark interpreted vs compiled
   %(prog)s --benchmark mapping.smap input.json
   %(prog)s --benchmark mapping.smap input.json --iterations 50000
+  
+  # Cache large inputs as CBOR between runs (needs cbor2)
+  %(prog)s --benchmark mapping.smap input.json --cache-binary
         """
     )
     
@@ -196,6 +252,8 @@ Examples:
     parser.add_argument("--class-name", default="GeneratedTransformer", help="Class name for compiled code")
     parser.add_argument("--functions", "-f", help="Python file with custom functions")
     parser.add_argument("--iterations", "-i", type=int, default=10000, help="Benchmark iterations")
+    parser.add_argument("--cache-binary", action="store_true",
+                        help="Cache the parsed input as <input>.cbor and reuse it (needs cbor2)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress output")
     parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
@@ -225,7 +283,8 @@ Examples:
             if not Path(args.input).exists():
                 print(f"Error: Input file not found: {args.input}", file=sys.stderr)
                 sys.exit(1)
-            run_benchmark(str(mapping_path), str(args.input), args.iterations, args.verbose)
+            run_benchmark(str(mapping_path), str(args.input), args.iterations, args.verbose,
+                          args.cache_binary)
             sys.exit(0)
         
         # Transform mode
@@ -238,8 +297,7 @@ Examples:
             sys.exit(1)
         
         # Load and transform
-        with open(args.input, 'r', encoding='utf-8') as f:
-            source_data = json.load(f)
+        source_data = _load_json(args.input, args.cache_binary)
         
         transformer = load_mapping(str(mapping_path))
         
@@ -257,13 +315,10 @@ Examples:
                     print("✓ Schema validation passed")
         
         # Output
-        if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, default=str)
-            if not args.quiet:
-                print(f"✓ Output saved to: {args.output}")
-        else:
-            print(json.dumps(result, indent=2, default=str))
+        with output_stream(args.output) as out:
+            write_json(out, result, indent=2)
+        if args.output and not args.quiet:
+            print(f"✓ Output saved to: {args.output}")
         
         sys.exit(0)
         
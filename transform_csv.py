@@ -16,17 +16,40 @@ Usage:
 """
 
 import argparse
-import json
+import codecs
 import sys
+from itertools import chain
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from jsonchamp.transformation import load_mapping, validate_json_schema
+from jsonchamp.transformation import load_mapping, load_schema_validator
 from jsonchamp.transformation.converters import CSVConverter, CSVPresets
+from jsonchamp.transformation.utils.runner import (
+    MAPPING_CACHE_DIR, output_stream, transform_records, write_json, write_records
+)
 from jsonchamp import __version__
 
 
+# Delimiters as typed on the command line, including escaped tab
+_DELIMITERS = {',': ',', ';': ';', '|': '|', '\t': '\t', '\\t': '\t'}
+
+
+def parse_delimiter(value: str) -> str:
+    """
+    Resolve a --delimiter argument, expanding escapes such as \\t.
+    
+    Values without a backslash are used as given, so non-ASCII
+    delimiters are not mangled by the escape decoding.
+    """
+    delimiter = _DELIMITERS.get(value)
+    if delimiter is not None:
+        return delimiter
+    if '\\' not in value:
+        return value
+    return codecs.decode(value, 'unicode_escape')
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Transform CSV data using SchemaMap DSL",
@@ -68,6 +91,10 @@ Examples:
     parser.add_argument("--output", "-o", help="Output path for JSON result")
     parser.add_argument("--functions", "-f", help="Python file with custom functions")
     parser.add_argument("--schema", "-s", help="JSON Schema for output validation")
+    parser.add_argument("--workers", "-j", type=int, default=1,
+                       help="Worker processes for transforming records (default: 1, 0 for one per CPU)")
+    parser.add_argument("--no-mapping-cache", action="store_true",
+                       help="Always re-parse the mapping instead of reusing the cached parse")
     
     # CSV options
     csv_group = parser.add_argument_group("CSV Options")
@@ -131,7 +158,7 @@ Examples:
             csv_options = {}
         
         # Override with explicit options
-        csv_options['delimiter'] = args.delimiter.encode().decode('unicode_escape')  # Handle \t
+        csv_options['delimiter'] = parse_delimiter(args.delimiter)
         csv_options['quotechar'] = args.quotechar
         csv_options['has_header'] = not args.no_header
         csv_options['skip_rows'] = args.skip_rows
@@ -142,76 +169,84 @@ Examples:
         if args.columns:
             csv_options['column_names'] = [c.strip() for c in args.columns.split(',')]
         
-        # Convert CSV to JSON
-        if args.verbose:
-            print(f"Reading CSV: {args.input}")
-            print(f"  Delimiter: {repr(csv_options['delimiter'])}")
-            print(f"  Has header: {csv_options['has_header']}")
-        
-        converter = CSVConverter(**csv_options)
-        records = list(converter.iterate_file(input_path))
-        
-        if args.verbose:
-            print(f"  Records found: {len(records)}")
-        
-        if not records:
-            print("Warning: No records found in CSV file", file=sys.stderr)
-            sys.exit(0)
-        
         # Load transformer
         if args.verbose:
             print(f"Loading mapping: {args.mapping}")
         
-        transformer = load_mapping(str(mapping_path))
+        cache_dir = None if args.no_mapping_cache else MAPPING_CACHE_DIR
+        transformer = load_mapping(str(mapping_path), cache_dir)
         
         # Register external functions
+        functions_path = None
         if args.functions:
             func_path = Path(args.functions)
             if func_path.exists():
-                transformer.register_file(str(func_path))
+                functions_path = str(func_path)
+                transformer.register_file(functions_path)
                 if args.verbose:
                     print(f"Loaded functions from: {args.functions}")
             else:
                 print(f"Warning: Functions file not found: {args.functions}", 
                       file=sys.stderr)
         
+        # Columns the mapping never reads are skipped without type inference
+        csv_options['needed_columns'] = transformer.mapping_file.referenced_source_keys()
+        
+        # Convert CSV to JSON
+        if args.verbose:
+            print(f"Reading CSV: {args.input}")
+            print(f"  Delimiter: {repr(csv_options['delimiter'])}")
+            print(f"  Has header: {csv_options['has_header']}")
+        
+        converter = CSVConverter(**csv_options)
+        records = converter.iterate_file(input_path)
+        
+        # Rows are streamed through the transformer; only peek at the first
+        first_record = next(records, None)
+        if first_record is None:
+            print("Warning: No records found in CSV file", file=sys.stderr)
+            sys.exit(0)
+        
         # Transform records
         if args.verbose:
             print("Transforming records...")
         
+        schema_path = Path(args.schema) if args.schema and Path(args.schema).exists() else None
+        indent = None if args.compact else 2
+        
+        validate = load_schema_validator(str(schema_path)) if schema_path else None
+        
+        def transformed():
+            return transform_records(chain([first_record], records), transformer,
+                                     (str(mapping_path), functions_path, cache_dir), args.workers)
+        
         if args.single:
-            results = transformer.transform(records[0])
+            results = transformer.transform(first_record)
+        elif args.wrap_array and schema_path:
+            # The schema applies to the wrapper object, so it must be complete
+            results = list(transformed())
+            results = {"records": results, "count": len(results)}
         else:
-            results = [transformer.transform(record) for record in records]
+            results = None
         
-        # Wrap in object if requested
-        if args.wrap_array and not args.single:
-            results = {"records": results, "count": len(results)}
+        if results is not None and schema_path:
+            validate(results)
         
-        # Validate if schema provided
-        if args.schema:
-            schema_path = Path(args.schema)
-            if schema_path.exists():
-                if isinstance(results, list):
-                    for i, result in enumerate(results):
-                        validate_json_schema(result, str(schema_path))
-                else:
-                    validate_json_schema(results, str(schema_path))
-                if args.verbose:
-                    print("✓ Schema validation passed")
+        with output_stream(args.output) as out:
+            if results is not None:
+                write_json(out, results, indent)
+                count = len(results["records"]) if args.wrap_array and not args.single else 1
+            else:
+                count = write_records(out, transformed(), indent, args.wrap_array, validate)
         
-        # Output
-        indent = None if args.compact else 2
-        json_output = json.dumps(results, indent=indent, default=str)
-        
-        if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(json_output)
-            if not args.quiet:
-                count = len(results) if isinstance(results, list) else 1
-                print(f"✓ Transformed {count} record(s) to: {args.output}")
-        else:
-            print(json_output)
+        if schema_path and args.verbose:
+            print("✓ Schema validation passed")
+        
+        if args.verbose:
+            print(f"  Records transformed: {count}")
+        
+        if args.output and not args.quiet:
+            print(f"✓ Transformed {count} record(s) to: {args.output}")
         
         sys.exit(0)
         
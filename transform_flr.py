@@ -15,15 +15,24 @@ Usage:
 """
 
 import argparse
-import json
 import sys
+from itertools import chain
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from jsonchamp.transformation import load_mapping, validate_json_schema
-from jsonchamp.transformation.converters import FLRConverter, FLRPresets, RecordLayout
-from jsonchamp import __version__
+
+class VersionAction(argparse.Action):
+    """--version that only imports jsonchamp when the option is actually given."""
+    
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):
+        super().__init__(option_strings, dest=dest, default=default, nargs=0, help=help)
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        from jsonchamp import __version__
+        print(f"{parser.prog} {__version__}")
+        parser.exit()
 
 
 def main():
@@ -35,7 +44,7 @@ Examples:
   # Basic FLR transformation with JSON layout
   %(prog)s mapping.smap customers.dat --layout customer_layout.json
   
-  # With output file
+  # With output file (compact unless --pretty is given)
   %(prog)s mapping.smap data.dat --layout layout.json --output transformed.json
   
   # Using simple text layout format
@@ -88,6 +97,10 @@ Layout File Formats:
     parser.add_argument("--output", "-o", help="Output path for JSON result")
     parser.add_argument("--functions", "-f", help="Python file with custom functions")
     parser.add_argument("--schema", "-s", help="JSON Schema for output validation")
+    parser.add_argument("--workers", "-j", type=int, default=1,
+                       help="Worker processes for transforming records (default: 1, 0 for one per CPU)")
+    parser.add_argument("--no-mapping-cache", action="store_true",
+                       help="Always re-parse the mapping instead of reusing the cached parse")
     
     # FLR options
     flr_group = parser.add_argument_group("FLR Options")
@@ -112,8 +125,8 @@ Layout File Formats:
                              help="Output single object (first record only)")
     output_group.add_argument("--wrap-array", action="store_true",
                              help="Wrap output in {\"records\": [...]} object")
-    output_group.add_argument("--pretty", action="store_true", default=True,
-                             help="Pretty-print JSON output (default)")
+    output_group.add_argument("--pretty", action="store_true", default=None,
+                             help="Pretty-print JSON output (default for stdout; files are compact)")
     output_group.add_argument("--compact", action="store_true",
                              help="Compact JSON output (no indentation)")
     output_group.add_argument("--show-json", action="store_true",
@@ -126,8 +139,7 @@ Layout File Formats:
                        help="Verbose output")
     parser.add_argument("--quiet", action="store_true",
                        help="Suppress status messages")
-    parser.add_argument("--version", action="version", 
-                       version=f"%(prog)s {__version__}")
+    parser.add_argument("--version", action=VersionAction)
     
     args = parser.parse_args()
     
@@ -147,6 +159,13 @@ Layout File Formats:
         print(f"Error: Layout file not found: {args.layout}", file=sys.stderr)
         sys.exit(1)
     
+    # Loaded only now so --help, --version and argument errors start quickly
+    from jsonchamp.transformation import load_mapping, load_schema_validator
+    from jsonchamp.transformation.converters import FLRConverter, FLRPresets, RecordLayout
+    from jsonchamp.transformation.utils.runner import (
+        MAPPING_CACHE_DIR, open_output, output_stream, transform_records, write_json, write_records
+    )
+    
     try:
         # Load layout
         if args.verbose:
@@ -163,13 +182,19 @@ Layout File Formats:
         
         # Show layout if requested
         if args.show_layout:
-            print("\n=== Record Layout ===")
-            print(f"Record Length: {layout.record_length}")
-            print(f"\n{'Field':<20} {'Start':>6} {'Length':>6} {'End':>6} {'Type':<10}")
-            print("-" * 60)
-            for field in layout.fields:
-                print(f"{field.name:<20} {field.start:>6} {field.length:>6} {field.end:>6} {field.data_type:<10}")
-            print()
+            # Built as one string so wide layouts go out in a single write
+            lines = [
+                "\n=== Record Layout ===",
+                f"Record Length: {layout.record_length}",
+                f"\n{'Field':<20} {'Start':>6} {'Length':>6} {'End':>6} {'Type':<10}",
+                "-" * 60,
+            ]
+            lines.extend(
+                f"{field.name:<20} {field.start:>6} {field.length:>6} {field.end:>6} {field.data_type:<10}"
+                for field in layout.fields
+            )
+            lines.append("\n")
+            sys.stdout.write("\n".join(lines))
         
         # Validate layout if requested
         if args.validate_layout:
@@ -206,34 +231,40 @@ Layout File Formats:
             print(f"  Encoding: {flr_options['encoding']}")
         
         converter = FLRConverter(layout=layout, **flr_options)
-        records = list(converter.iterate_file(input_path))
-        
-        if args.verbose:
-            print(f"  Records found: {len(records)}")
+        records = converter.iterate_file(input_path)
         
-        if not records:
+        # Records are streamed through the transformer; only peek at the first
+        first_record = next(records, None)
+        if first_record is None:
             print("Warning: No records found in FLR file", file=sys.stderr)
             sys.exit(0)
         
+        if args.single:
+            # Only the first record is used; close the input file right away
+            records.close()
+        
         # Show intermediate JSON if requested
         if args.show_json:
             print("\n=== FLR to JSON Conversion (first record) ===")
-            print(json.dumps(records[0], indent=2, default=str))
-            if len(records) > 1:
-                print(f"\n... and {len(records) - 1} more records")
+            out = open_output()
+            write_json(out, first_record, 2)
+            out.write(b"\n")
             print()
         
         # Load transformer
         if args.verbose:
             print(f"Loading mapping: {args.mapping}")
         
-        transformer = load_mapping(str(mapping_path))
+        cache_dir = None if args.no_mapping_cache else MAPPING_CACHE_DIR
+        transformer = load_mapping(str(mapping_path), cache_dir)
         
         # Register external functions
+        functions_path = None
         if args.functions:
             func_path = Path(args.functions)
             if func_path.exists():
-                transformer.register_file(str(func_path))
+                functions_path = str(func_path)
+                transformer.register_file(functions_path)
                 if args.verbose:
                     print(f"Loaded functions from: {args.functions}")
             else:
@@ -244,39 +275,44 @@ Layout File Formats:
         if args.verbose:
             print("Transforming records...")
         
+        schema_path = Path(args.schema) if args.schema and Path(args.schema).exists() else None
+        # Files are usually read by other programs, so pretty-print them only on request
+        pretty = args.pretty if args.pretty is not None else not args.output
+        indent = 2 if pretty and not args.compact else None
+        
+        validate = load_schema_validator(str(schema_path)) if schema_path else None
+        
+        def transformed():
+            return transform_records(chain([first_record], records), transformer,
+                                     (str(mapping_path), functions_path, cache_dir), args.workers)
+        
         if args.single:
-            results = transformer.transform(records[0])
+            results = transformer.transform(first_record)
+        elif args.wrap_array and schema_path:
+            # The schema applies to the wrapper object, so it must be complete
+            results = list(transformed())
+            results = {"records": results, "count": len(results)}
         else:
-            results = [transformer.transform(record) for record in records]
+            results = None
         
-        # Wrap in object if requested
-        if args.wrap_array and not args.single:
-            results = {"records": results, "count": len(results)}
+        if results is not None and schema_path:
+            validate(results)
         
-        # Validate if schema provided
-        if args.schema:
-            schema_path = Path(args.schema)
-            if schema_path.exists():
-                if isinstance(results, list):
-                    for i, result in enumerate(results):
-                        validate_json_schema(result, str(schema_path))
-                else:
-                    validate_json_schema(results, str(schema_path))
-                if args.verbose:
-                    print("✓ Schema validation passed")
+        with output_stream(args.output) as out:
+            if results is not None:
+                write_json(out, results, indent)
+                count = len(results["records"]) if args.wrap_array and not args.single else 1
+            else:
+                count = write_records(out, transformed(), indent, args.wrap_array, validate)
         
-        # Output
-        indent = None if args.compact else 2
-        json_output = json.dumps(results, indent=indent, default=str)
+        if schema_path and args.verbose:
+            print("✓ Schema validation passed")
         
-        if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(json_output)
-            if not args.quiet:
-                count = len(results) if isinstance(results, list) else 1
-                print(f"✓ Transformed {count} record(s) to: {args.output}")
-        else:
-            print(json_output)
+        if args.verbose:
+            print(f"  Records transformed: {count}")
+        
+        if args.output and not args.quiet:
+            print(f"✓ Transformed {count} record(s) to: {args.output}")
         
         sys.exit(0)
         
@@ -16,15 +16,15 @@ Usage:
 """
 
 import argparse
-import json
 import sys
+from itertools import chain, islice
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from jsonchamp.transformation import load_mapping, validate_json_schema
-from jsonchamp.transformation.converters import XMLConverter, XMLPresets
-from jsonchamp import __version__
+# Shared with the FLR runner; kept out of jsonchamp so that --help and
+# --version do not load the whole package
+from transform_flr import VersionAction
 
 
 def main():
@@ -36,7 +36,7 @@ Examples:
   # Basic XML transformation (entire document)
   %(prog)s mapping.smap order.xml
   
-  # With output file
+  # With output file (compact unless --pretty is given)
   %(prog)s mapping.smap order.xml --output transformed.json
   
   # Process multiple records from XML
@@ -69,6 +69,10 @@ Examples:
     parser.add_argument("--output", "-o", help="Output path for JSON result")
     parser.add_argument("--functions", "-f", help="Python file with custom functions")
     parser.add_argument("--schema", "-s", help="JSON Schema for output validation")
+    parser.add_argument("--workers", "-j", type=int, default=1,
+                       help="Worker processes for transforming records (default: 1, 0 for one per CPU)")
+    parser.add_argument("--no-mapping-cache", action="store_true",
+                       help="Always re-parse the mapping instead of reusing the cached parse")
     
     # XML options
     xml_group = parser.add_argument_group("XML Options")
@@ -99,8 +103,8 @@ Examples:
     output_group = parser.add_argument_group("Output Options")
     output_group.add_argument("--wrap-array", action="store_true",
                              help="Wrap output in {\"records\": [...]} object (with --records)")
-    output_group.add_argument("--pretty", action="store_true", default=True,
-                             help="Pretty-print JSON output (default)")
+    output_group.add_argument("--pretty", action="store_true", default=None,
+                             help="Pretty-print JSON output (default for stdout; files are compact)")
     output_group.add_argument("--compact", action="store_true",
                              help="Compact JSON output (no indentation)")
     output_group.add_argument("--show-xml-json", action="store_true",
@@ -111,8 +115,7 @@ Examples:
                        help="Verbose output")
     parser.add_argument("--quiet", action="store_true",
                        help="Suppress status messages")
-    parser.add_argument("--version", action="version", 
-                       version=f"%(prog)s {__version__}")
+    parser.add_argument("--version", action=VersionAction)
     
     args = parser.parse_args()
     
@@ -127,6 +130,13 @@ Examples:
         print(f"Error: Input file not found: {args.input}", file=sys.stderr)
         sys.exit(1)
     
+    # Loaded only now so --help, --version and argument errors start quickly
+    from jsonchamp.transformation import load_mapping, load_schema_validator
+    from jsonchamp.transformation.converters import XMLConverter, XMLPresets
+    from jsonchamp.transformation.utils.runner import (
+        MAPPING_CACHE_DIR, open_output, output_stream, transform_records, write_json, write_records
+    )
+    
     try:
         # Build XML options
         if args.preset:
@@ -146,7 +156,7 @@ Examples:
         xml_options['encoding'] = args.encoding
         
         if args.always_array:
-            xml_options['always_array'] = [a.strip() for a in args.always_array.split(',')]
+            xml_options['always_array'] = frozenset(a.strip() for a in args.always_array.split(','))
         
         # Convert XML to JSON
         if args.verbose:
@@ -160,37 +170,44 @@ Examples:
             # Multiple records mode
             if args.verbose:
                 print(f"  Record path: {args.records}")
-            records = converter.convert_file_elements(input_path, args.records)
-            if args.verbose:
-                print(f"  Records found: {len(records)}")
+            # Records are streamed through the transformer; only peek at the first
+            records = converter.iter_file_elements(input_path, args.records)
+            head = list(islice(records, 1))
+            if not head:
+                print("Warning: No records found in XML file", file=sys.stderr)
+                sys.exit(0)
+            records = chain(head, records)
         else:
             # Single document mode
-            records = [converter.convert_file(input_path)]
+            document = converter.convert_file(input_path)
+            records = None
             if args.verbose:
                 print(f"  Single document mode")
         
-        if not records:
-            print("Warning: No records found in XML file", file=sys.stderr)
-            sys.exit(0)
-        
         # Show intermediate JSON if requested
         if args.show_xml_json:
+            shown = [document] if records is None else list(records)
+            records = None if records is None else iter(shown)
             print("\n=== XML to JSON Conversion ===")
-            print(json.dumps(records[0] if len(records) == 1 else records, 
-                           indent=2, default=str))
+            out = open_output()
+            write_json(out, shown[0] if len(shown) == 1 else shown, 2)
+            out.write(b"\n")
             print("==============================\n")
         
         # Load transformer
         if args.verbose:
             print(f"Loading mapping: {args.mapping}")
         
-        transformer = load_mapping(str(mapping_path))
+        cache_dir = None if args.no_mapping_cache else MAPPING_CACHE_DIR
+        transformer = load_mapping(str(mapping_path), cache_dir)
         
         # Register external functions
+        functions_path = None
         if args.functions:
             func_path = Path(args.functions)
             if func_path.exists():
-                transformer.register_file(str(func_path))
+                functions_path = str(func_path)
+                transformer.register_file(functions_path)
                 if args.verbose:
                     print(f"Loaded functions from: {args.functions}")
             else:
@@ -201,47 +218,46 @@ Examples:
         if args.verbose:
             print("Transforming records...")
         
-        if args.records:
-            # Multiple records
-            results = [transformer.transform(record) for record in records]
-            
-            # Wrap in object if requested
-            if args.wrap_array:
-                results = {"records": results, "count": len(results)}
-        else:
-            # Single document
-            results = transformer.transform(records[0])
+        schema_path = Path(args.schema) if args.schema and Path(args.schema).exists() else None
+        # Files are usually read by other programs, so pretty-print them only on request
+        pretty = args.pretty if args.pretty is not None else not args.output
+        indent = 2 if pretty and not args.compact else None
+        
+        validate = load_schema_validator(str(schema_path)) if schema_path else None
         
-        # Validate if schema provided
-        if args.schema:
-            schema_path = Path(args.schema)
-            if schema_path.exists():
+        if records is None:
+            # Single document
+            results = transformer.transform(document)
+            if schema_path:
                 if isinstance(results, list):
                     for result in results:
-                        validate_json_schema(result, str(schema_path))
+                        validate(result)
                 elif isinstance(results, dict) and 'records' in results:
                     for result in results['records']:
-                        validate_json_schema(result, str(schema_path))
+                        validate(result)
                 else:
-                    validate_json_schema(results, str(schema_path))
-                if args.verbose:
-                    print("✓ Schema validation passed")
+                    validate(results)
         
         # Output
-        indent = None if args.compact else 2
-        json_output = json.dumps(results, indent=indent, default=str)
+        with output_stream(args.output) as out:
+            if records is None:
+                write_json(out, results, indent)
+            else:
+                items = transform_records(records, transformer,
+                                          (str(mapping_path), functions_path, cache_dir), args.workers)
+                count = write_records(out, items, indent, args.wrap_array, validate)
         
-        if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(json_output)
-            if not args.quiet:
-                if args.records:
-                    count = results.get('count', len(results)) if isinstance(results, dict) else len(results)
-                    print(f"✓ Transformed {count} record(s) to: {args.output}")
-                else:
-                    print(f"✓ Transformed XML to: {args.output}")
-        else:
-            print(json_output)
+        if schema_path and args.verbose:
+            print("✓ Schema validation passed")
+        
+        if records is not None and args.verbose:
+            print(f"  Records transformed: {count}")
+        
+        if args.output and not args.quiet:
+            if records is not None:
+                print(f"✓ Transformed {count} record(s) to: {args.output}")
+            else:
+                print(f"✓ Transformed XML to: {args.output}")
         
         sys.exit(0)
         